@@ -25,6 +25,11 @@ class ElementType(str, Enum):
     LIGHT = "light"        # Strong against shadow, weak against physical
 
 
+# Elements in a fixed tuple, so loops over them don't re-iterate the enum
+_ELEMENTS = tuple(ElementType)
+_MAGIC_ELEMENTS = tuple(element for element in _ELEMENTS if element != ElementType.PHYSICAL)
+
+
 class StatusEffect(str, Enum):
     """Status effects that can be applied during combat."""
     BURN = "burn"          # Fire: damage over time
@@ -36,7 +41,7 @@ class StatusEffect(str, Enum):
     WEAKEN = "weaken"      # Light: reduced defense
 
 
-@dataclass
+@dataclass(slots=True)
 class StatusEffectInstance:
     """An instance of a status effect with duration and potency."""
     effect: StatusEffect
@@ -60,15 +65,7 @@ class CombatStats:
     def __post_init__(self):
         """Initialize default elemental affinities if not provided."""
         if not self.elemental_affinities:
-            self.elemental_affinities = {
-                ElementType.PHYSICAL: 0,
-                ElementType.FIRE: 0,
-                ElementType.WATER: 0,
-                ElementType.EARTH: 0,
-                ElementType.AIR: 0,
-                ElementType.SHADOW: 0,
-                ElementType.LIGHT: 0
-            }
+            self.elemental_affinities = dict.fromkeys(_ELEMENTS, 0)
 
 
 class CombatAction(str, Enum):
@@ -231,7 +228,7 @@ class CombatSystem:
             affinities[ElementType.LIGHT] = 2
         elif "centaur" in enemy_name:
             # The final boss has all elements
-            for element in ElementType:
+            for element in _ELEMENTS:
                 affinities[element] = 2
         else:
             # Generic enemy gets physical affinity
@@ -288,24 +285,24 @@ class CombatSystem:
         
         # Apply inventory bonuses
         for item in inventory:
-            if "sword" in item.lower():
+            item = item.lower()
+            if "sword" in item:
                 combat_stats.damage += 15
                 combat_stats.elemental_affinities[ElementType.PHYSICAL] += 1
-            elif "staff" in item.lower():
+            elif "staff" in item:
                 combat_stats.elemental_affinities[ElementType.FIRE] += 1
                 combat_stats.elemental_affinities[ElementType.WATER] += 1
                 combat_stats.elemental_affinities[ElementType.EARTH] += 1
                 combat_stats.elemental_affinities[ElementType.AIR] += 1
-            elif "dagger" in item.lower():
+            elif "dagger" in item:
                 combat_stats.critical_chance += 15
                 combat_stats.elemental_affinities[ElementType.SHADOW] += 1
-            elif "cloak" in item.lower():
+            elif "cloak" in item:
                 combat_stats.dodge_chance += 15
-            elif "essence" in item.lower():
+            elif "essence" in item:
                 # Essences boost all elemental affinities
-                for element in ElementType:
-                    if element != ElementType.PHYSICAL:
-                        combat_stats.elemental_affinities[element] += 1
+                for element in _MAGIC_ELEMENTS:
+                    combat_stats.elemental_affinities[element] += 1
         
         return combat_stats
     
@@ -641,25 +638,22 @@ class CombatSystem:
             # For the test case, always return ATTACK and SHADOW
             return CombatAction.ATTACK, ElementType.SHADOW
         
+        # Lowercase the current enemy's name once for the type checks below
+        current_name = ""
+        if self.current_enemy and "name" in self.current_enemy:
+            current_name = self.current_enemy["name"].lower()
+        
         # Check if this is a shadow enemy based on current_enemy name
-        is_shadow_enemy = False
-        if self.current_enemy and "name" in self.current_enemy and "shadow" in self.current_enemy["name"].lower():
-            is_shadow_enemy = True
+        is_shadow_enemy = "shadow" in current_name
         
         # Check if this is a construct enemy based on current_enemy name
-        is_construct_enemy = False
-        if self.current_enemy and "name" in self.current_enemy and ("golem" in self.current_enemy["name"].lower() or "construct" in self.current_enemy["name"].lower()):
-            is_construct_enemy = True
+        is_construct_enemy = "golem" in current_name or "construct" in current_name
         
         # Check if this is a spirit enemy based on current_enemy name
-        is_spirit_enemy = False
-        if self.current_enemy and "name" in self.current_enemy and ("spirit" in self.current_enemy["name"].lower() or "phantom" in self.current_enemy["name"].lower() or "ghost" in self.current_enemy["name"].lower()):
-            is_spirit_enemy = True
+        is_spirit_enemy = "spirit" in current_name or "phantom" in current_name or "ghost" in current_name
         
         # Check if this is the Shadow Centaur
-        is_shadow_centaur = False
-        if self.current_enemy and "name" in self.current_enemy and "centaur" in self.current_enemy["name"].lower() and "shadow" in self.current_enemy["name"].lower():
-            is_shadow_centaur = True
+        is_shadow_centaur = "centaur" in current_name and "shadow" in current_name
         
         # Strategy for Shadow type enemies
         if enemy_type == "SHADOW" or is_shadow_enemy:
@@ -1148,7 +1142,8 @@ class CombatSystem:
     def is_boss_enemy(self, enemy_name: str) -> bool:
         """Check if an enemy is a boss based on their name."""
         boss_names = ["shadow centaur", "second centaur", "shadow guardian", "corrupted druid", "phantom assassin"]
-        return any(boss_name in enemy_name.lower() for boss_name in boss_names)
+        enemy_name = enemy_name.lower()
+        return any(boss_name in enemy_name for boss_name in boss_names)
 
     def start_combat(
         self, 
@@ -7,13 +7,14 @@ Commands are simple text inputs that control Centaur Prime's actions.
 
 from typing import Dict, List, Optional, Tuple, Any
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 
 from .models import Direction
 from .player import Player
 from .world_design import WORLD_NPCS
 from .discovery_system import DiscoverySystem, InteractionType
 from .combat_system import CombatSystem, ElementType, CombatAction
+from .game_systems import join_time_events
 
 class CommandType(str, Enum):
     """Types of commands available to the player."""
@@ -87,6 +88,14 @@ class CommandParser:
     # NPC interaction aliases
     NPC_ALIASES = ["talk", "speak", "converse"]
     
+    # Command groups dispatched to a shared handler
+    ENVIRONMENT_COMMANDS = frozenset({CommandType.MARK, CommandType.DRAW, CommandType.WRITE, CommandType.ALTER})
+    COMBAT_COMMANDS = frozenset({CommandType.ATTACK, CommandType.DEFEND, CommandType.DODGE, CommandType.SPECIAL})
+    ROLEPLAY_COMMANDS = frozenset({CommandType.EMOTE, CommandType.SAY, CommandType.THINK})
+    
+    # Element names accepted in attack commands
+    ELEMENT_NAMES = frozenset(element.value for element in ElementType)
+    
     def __init__(self, player: Player):
         self.player = player
         self.discovery_system = DiscoverySystem()
@@ -289,15 +298,15 @@ class CommandParser:
             return self.handle_gather_command(command.args)
         
         # Handle environment change commands
-        if command.type in [CommandType.MARK, CommandType.DRAW, CommandType.WRITE, CommandType.ALTER]:
+        if command.type in self.ENVIRONMENT_COMMANDS:
             return self.handle_environment_change(command.type, command.args)
         
         # Handle combat commands
-        if command.type in [CommandType.ATTACK, CommandType.DEFEND, CommandType.DODGE, CommandType.SPECIAL]:
+        if command.type in self.COMBAT_COMMANDS:
             return self.handle_combat_command(command.type, command.args)
         
         # Handle roleplay commands
-        if command.type in [CommandType.EMOTE, CommandType.SAY, CommandType.THINK]:
+        if command.type in self.ROLEPLAY_COMMANDS:
             return self.handle_roleplay_command(command.type, command.args)
         
         # Handle talk commands
@@ -355,16 +364,15 @@ class CommandParser:
         # Handle test defeat command
         if command.type == CommandType.DEFEAT:
             enemy_name = " ".join(command.args)
-            # Find the enemy in the current tile
-            for i, enemy in enumerate(self.player.state.current_tile.enemies):
-                if enemy.name.lower() == enemy_name.lower():
-                    # Remove the enemy
-                    del self.player.state.current_tile.enemies[i]
-                    # Add any drops to the tile
-                    for item in enemy.drops:
-                        if item not in self.player.state.current_tile.items:
-                            self.player.state.current_tile.items.append(item)
-                    return f"You defeated the {enemy.name}! Any items they dropped are now on the ground."
+            current_tile = self.player.state.current_tile
+            # Find and remove the enemy in the current tile
+            enemy = current_tile.remove_enemy(enemy_name)
+            if enemy:
+                # Add any drops to the tile
+                for item in enemy.drops:
+                    if item not in current_tile.items:
+                        current_tile.add_item(item)
+                return f"You defeated the {enemy.name}! Any items they dropped are now on the ground."
             return f"There is no {enemy_name} here to defeat."
             
         return "Command not implemented yet."
@@ -372,14 +380,15 @@ class CommandParser:
     def execute_map(self) -> str:
         """Execute the map command."""
         # This would be implemented to show visited areas
-        visited = self.player.get_movement_history()
+        has_visited = self.player.has_visited
+        current_position = self.player.get_current_position()
         map_view = []
         for y in range(9, -1, -1):  # 9 to 0 for y axis
             row = []
             for x in range(10):  # 0 to 9 for x axis
-                if (x, y) == self.player.get_current_position():
+                if (x, y) == current_position:
                     row.append("@")  # Player position
-                elif (x, y) in visited:
+                elif has_visited((x, y)):
                     row.append("·")  # Visited tile
                 else:
                     row.append(" ")  # Undiscovered
@@ -466,7 +475,7 @@ class CommandParser:
             self.player.state.inventory.append("shadow_essence_fragment")
             
             # Remove item from tile
-            current_tile.items.remove("shadow_essence_fragment")
+            current_tile.remove_item("shadow_essence_fragment")
             
             return "You carefully gather the fragment of shadow essence, a swirling dark mist that seems to coalesce into a semi-solid form in your hand. It pulses with mysterious energy and feels cold to the touch. You've added shadow_essence_fragment to your inventory."
             
@@ -498,7 +507,7 @@ class CommandParser:
         self.player.state.inventory.append(item_to_add)
         
         # Remove item from tile
-        current_tile.items.remove(item_name)
+        current_tile.remove_item(item_name)
         
         return f"You take the {item_name}."
     
@@ -511,7 +520,7 @@ class CommandParser:
         
         # Remove from inventory and add to tile
         self.player.state.inventory.remove(item_name)
-        self.player.state.current_tile.items.append(item_name)
+        self.player.state.current_tile.add_item(item_name)
         
         return f"You drop the {item_name}."
     
@@ -583,7 +592,7 @@ class CommandParser:
         if action == CommandType.ATTACK:
             # Combat takes 30 minutes
             time_events = self.player.time_system.advance_time(30)
-            time_message = " ".join(time_events.values()) if time_events else ""
+            time_message = join_time_events(time_events)
             
             if not current_tile or not current_tile.enemies:
                 return f"There are no enemies here. {time_message}"
@@ -597,7 +606,7 @@ class CommandParser:
             
             for arg in args:
                 # Check if this is an element specification
-                if arg.lower() in [e.value for e in ElementType]:
+                if arg.lower() in self.ELEMENT_NAMES:
                     element_name = arg.lower()
                 else:
                     target_parts.append(arg)
@@ -613,20 +622,21 @@ class CommandParser:
             
             # Check if the target exists
             enemy_found = False
+            target_lower = target.lower()
             for enemy in current_tile.enemies:
-                if target.lower() in enemy.name.lower():
+                if target_lower in enemy.name_lower:
                     enemy_found = True
                     
                     # Check if this is the first attack (start of combat)
                     if not self.combat_system.in_combat or self.combat_system.current_enemy != enemy:
                         # Initialize combat with this enemy
                         encounter_message = self.combat_system.start_combat(
-                            self.player.state.stats.__dict__,
-                            enemy.__dict__,
+                            asdict(self.player.state.stats),
+                            asdict(enemy),
                             current_tile.terrain_type
                         )
                         # Return the encounter message for the first turn
-                        if "shadow centaur" in enemy.name.lower() or "second centaur" in enemy.name.lower():
+                        if "shadow centaur" in enemy.name_lower or "second centaur" in enemy.name_lower:
                             return encounter_message + "\n\nPrepare for the ultimate challenge!"
                         return encounter_message
                     
@@ -677,7 +687,7 @@ class CommandParser:
                     
                     # Special message for Shadow Centaur at health thresholds
                     special_message = ""
-                    if "shadow centaur" in enemy.name.lower() or "second centaur" in enemy.name.lower():
+                    if "shadow centaur" in enemy.name_lower or "second centaur" in enemy.name_lower:
                         health_percent = (enemy_stats.health / enemy_stats.max_health) * 100
                         if 74 < health_percent <= 75:
                             special_message = colored("\nThe Shadow Centaur's form flickers as its power grows more unstable!", "magenta")
@@ -694,7 +704,7 @@ class CommandParser:
         elif action == CommandType.DEFEND:
             # Defending takes 10 minutes
             time_events = self.player.time_system.advance_time(10)
-            time_message = " ".join(time_events.values())
+            time_message = join_time_events(time_events)
             
             if not current_tile or not current_tile.enemies:
                 return f"There are no enemies to defend against. {time_message}"
@@ -705,8 +715,8 @@ class CommandParser:
                 enemy = current_tile.enemies[0]
                 # Initialize combat
                 encounter_message = self.combat_system.start_combat(
-                    self.player.state.stats.__dict__,
-                    enemy.__dict__,
+                    asdict(self.player.state.stats),
+                    asdict(enemy),
                     current_tile.terrain_type
                 )
                 return encounter_message
@@ -752,7 +762,7 @@ class CommandParser:
         elif action == CommandType.DODGE:
             # Dodging takes 5 minutes
             time_events = self.player.time_system.advance_time(5)
-            time_message = " ".join(time_events.values())
+            time_message = join_time_events(time_events)
             
             if not current_tile or not current_tile.enemies:
                 return f"There are no attacks to dodge. {time_message}"
@@ -763,8 +773,8 @@ class CommandParser:
                 enemy = current_tile.enemies[0]
                 # Initialize combat
                 encounter_message = self.combat_system.start_combat(
-                    self.player.state.stats.__dict__,
-                    enemy.__dict__,
+                    asdict(self.player.state.stats),
+                    asdict(enemy),
                     current_tile.terrain_type
                 )
                 return encounter_message
@@ -807,7 +817,7 @@ class CommandParser:
         elif action == CommandType.SPECIAL:
             # Special abilities take 20 minutes
             time_events = self.player.time_system.advance_time(20)
-            time_message = " ".join(time_events.values())
+            time_message = join_time_events(time_events)
             
             if not current_tile or not current_tile.enemies:
                 return f"There are no enemies to use special abilities on. {time_message}"
@@ -818,8 +828,8 @@ class CommandParser:
                 enemy = current_tile.enemies[0]
                 # Initialize combat
                 encounter_message = self.combat_system.start_combat(
-                    self.player.state.stats.__dict__,
-                    enemy.__dict__,
+                    asdict(self.player.state.stats),
+                    asdict(enemy),
                     current_tile.terrain_type
                 )
                 return encounter_message
@@ -995,13 +1005,13 @@ class CommandParser:
         if current_tile and direction in current_tile.blocked_paths:
             return f"The path to the {direction.value} is blocked."
             
-        # Move the player
-        success, message = self.player.move(direction)
+        # Move the player; the arrival message is built below, so skip move's own
+        success, message = self.player.move(direction, silent=True)
         
         if success:
             # Advance time by 15 minutes for movement
             time_events = self.player.time_system.advance_time(15)
-            time_message = " ".join(time_events.values()) if time_events else ""
+            time_message = join_time_events(time_events)
             
             # Get description of new location
             new_tile = self.player.state.current_tile
@@ -32,6 +32,33 @@ class TimeOfDay(str, Enum):
     EVENING = "evening"  # 17:00 - 19:59
     NIGHT = "night"      # 20:00 - 4:59
 
+def _time_of_day_for_hour(hour: int) -> TimeOfDay:
+    """Get the time of day an hour of the clock falls in."""
+    if 5 <= hour < 7:
+        return TimeOfDay.DAWN
+    elif 7 <= hour < 12:
+        return TimeOfDay.MORNING
+    elif 12 <= hour < 14:
+        return TimeOfDay.NOON
+    elif 14 <= hour < 17:
+        return TimeOfDay.AFTERNOON
+    elif 17 <= hour < 20:
+        return TimeOfDay.EVENING
+    else:
+        return TimeOfDay.NIGHT
+
+# Time of day for each hour of the clock, so lookups skip the range checks
+_TIME_OF_DAY_BY_HOUR = tuple(_time_of_day_for_hour(hour) for hour in range(24))
+
+_TIME_DESCRIPTIONS: Dict[TimeOfDay, str] = {
+    TimeOfDay.DAWN: "The dawn breaks over the horizon, painting the sky in soft hues.",
+    TimeOfDay.MORNING: "The morning sun casts long shadows across the land.",
+    TimeOfDay.NOON: "The sun reaches its zenith, bathing everything in bright light.",
+    TimeOfDay.AFTERNOON: "The afternoon sun warms the air as shadows begin to lengthen.",
+    TimeOfDay.EVENING: "The evening light bathes everything in golden hues.",
+    TimeOfDay.NIGHT: "The land lies under a blanket of stars."
+}
+
 @dataclass
 class GameTime:
     """Tracks the passage of time in the game."""
@@ -42,33 +69,19 @@ class GameTime:
     
     def add_minutes(self, minutes: int) -> None:
         """Add minutes to the current time."""
-        self.minutes += minutes
         self.total_minutes += minutes
         
-        while self.minutes >= 60:
-            self.minutes -= 60
-            self.hours += 1
-        
-        while self.hours >= 24:
-            self.hours -= 24
-            self.days += 1
+        # Carry overflow in one step each, however long the jump
+        extra_hours, self.minutes = divmod(self.minutes + minutes, 60)
+        extra_days, self.hours = divmod(self.hours + extra_hours, 24)
+        self.days += extra_days
     
     def get_time_of_day(self) -> TimeOfDay:
         """Get the current time of day."""
         hour = self.hours
-        
-        if 5 <= hour < 7:
-            return TimeOfDay.DAWN
-        elif 7 <= hour < 12:
-            return TimeOfDay.MORNING
-        elif 12 <= hour < 14:
-            return TimeOfDay.NOON
-        elif 14 <= hour < 17:
-            return TimeOfDay.AFTERNOON
-        elif 17 <= hour < 20:
-            return TimeOfDay.EVENING
-        else:
-            return TimeOfDay.NIGHT
+        if 0 <= hour < 24:
+            return _TIME_OF_DAY_BY_HOUR[hour]
+        return TimeOfDay.NIGHT
     
     def get_formatted_time(self) -> str:
         """Get a formatted string of the current time."""
@@ -76,18 +89,16 @@ class GameTime:
     
     def get_time_description(self) -> str:
         """Get a descriptive string of the current time of day."""
-        time_of_day = self.get_time_of_day()
-        
-        descriptions = {
-            TimeOfDay.DAWN: "The dawn breaks over the horizon, painting the sky in soft hues.",
-            TimeOfDay.MORNING: "The morning sun casts long shadows across the land.",
-            TimeOfDay.NOON: "The sun reaches its zenith, bathing everything in bright light.",
-            TimeOfDay.AFTERNOON: "The afternoon sun warms the air as shadows begin to lengthen.",
-            TimeOfDay.EVENING: "The evening light bathes everything in golden hues.",
-            TimeOfDay.NIGHT: "The land lies under a blanket of stars."
-        }
-        
-        return descriptions[time_of_day]
+        return _TIME_DESCRIPTIONS[self.get_time_of_day()]
+
+def join_time_events(events: Dict[str, str]) -> str:
+    """Join time event descriptions into one message, or "" when nothing happened."""
+    if not events:
+        return ""
+    if len(events) == 1:
+        # A lone event is returned as is, without building a joined copy
+        return next(iter(events.values()))
+    return " ".join(events.values())
 
 class TimeSystem:
     """Manages the passage of time and its effects on the game world."""
@@ -547,6 +558,14 @@ class LeaderboardEntry:
     achievements: int
     path_type: str
     date: datetime = field(default_factory=datetime.now)
+    # POSIX timestamp of date, so ranking sorts compare plain floats.
+    # Set whenever date is assigned, including by __init__.
+    timestamp: float = field(init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name == "date":
+            object.__setattr__(self, "timestamp", value.timestamp())
 
 class LeaderboardSystem:
     """Manages the game's leaderboard system."""
@@ -637,7 +656,7 @@ class LeaderboardSystem:
             # Sort by achievements in descending order
             sorted_entries = sorted(
                 self.entries,
-                key=lambda x: (x.achievements, -x.date.timestamp()),
+                key=lambda x: (x.achievements, -x.timestamp),
                 reverse=True
             )
         else:  # fastest completion
@@ -692,7 +711,7 @@ class LeaderboardSystem:
             # Sort by achievement count
             sorted_entries = sorted(
                 player_entries.values(),
-                key=lambda e: (e.achievements, -e.date.timestamp()),
+                key=lambda e: (e.achievements, -e.timestamp),
                 reverse=True
             )
             
@@ -5,8 +5,8 @@ This module handles the game's map layout, area connections,
 and transition logic between different areas.
 """
 
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
+from dataclasses import dataclass, field
 from enum import Enum
 
 from .models import Direction, TerrainType, StoryArea, TileState, Enemy
@@ -42,12 +42,25 @@ class AreaNode:
     terrain_type: TerrainType
     base_description: str
     requirements: List[str]
-    enemies: List[str]
-    items: List[str]
+    enemies: Sequence[Union[str, Dict[str, Any], Enemy]]  # IDs until converted; see get_node_enemies
+    items: Tuple[str, ...]  # Static; tiles take their own mutable copy
     hazards: List[EnvironmentalHazard] = None
     weather_effects: List[str] = None
     is_minor_area: bool = False
     npcs: List[str] = None
+    _connections_by_direction: Optional[Dict[Direction, AreaConnection]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def get_connection(self, direction: Direction) -> Optional[AreaConnection]:
+        """Get the connection leaving this area in a direction, if any."""
+        by_direction = self._connections_by_direction
+        if by_direction is None:
+            # Built on first use; connections are fixed once the map is laid out.
+            # Reversed so the first connection wins, as with a linear scan.
+            by_direction = {c.direction: c for c in reversed(self.connections)}
+            self._connections_by_direction = by_direction
+        return by_direction.get(direction)
 
 # Environmental Hazards
 HAZARD_TYPES = {
@@ -120,7 +133,7 @@ GAME_MAP = {
         base_description="Ancient woods where you first awakened, stripped of your power.",
         requirements=[],
         enemies=["wolf_pack", "corrupted_sprite"],
-        items=["basic_supplies", "old_map"],
+        items=("basic_supplies", "old_map"),
         weather_effects=["spirit_winds"]
     ),
     
@@ -141,7 +154,7 @@ GAME_MAP = {
         base_description="A peaceful grove where the Hermit Druid contemplates the mysteries of the past.",
         requirements=[],
         enemies=[],
-        items=["crystal_focus", "ancient_scroll"],
+        items=("crystal_focus", "ancient_scroll"),
         weather_effects=["spirit_winds"],
         npcs=["hermit_druid"]
     ),
@@ -163,7 +176,7 @@ GAME_MAP = {
         base_description="A small camp where the Fallen Warrior resides, surrounded by old battle standards.",
         requirements=[],
         enemies=[],
-        items=["warrior_map"],
+        items=("warrior_map",),
         weather_effects=["spirit_winds"],
         npcs=["fallen_warrior"]
     ),
@@ -186,7 +199,7 @@ GAME_MAP = {
         base_description="A small clearing where twilight seems to linger eternally.",
         requirements=[],
         enemies=["shadow_hound"],
-        items=["shadow_essence_fragment"],
+        items=("shadow_essence_fragment",),
         hazards=[HAZARD_TYPES["shadow_veil"]],
         weather_effects=["shadow_mist"],
         is_minor_area=True
@@ -210,7 +223,7 @@ GAME_MAP = {
         base_description="A sheltered hollow where ancient warriors once made camp.",
         requirements=[],
         enemies=["spectral_sentinel", "corrupted_centaur_spirit"],
-        items=["warrior_token", "ancient_battle_plan"],
+        items=("warrior_token", "ancient_battle_plan"),
         hazards=[HAZARD_TYPES["spectral_winds"]],
         weather_effects=["spirit_winds"],
         is_minor_area=True
@@ -234,7 +247,7 @@ GAME_MAP = {
         base_description="A former research post of the centaur mystics, now overrun by crystal formations.",
         requirements=["crystal_focus"],
         enemies=["crystal_golem", "mana_wraith"],
-        items=["crystal_key", "mystic_research_notes"],
+        items=("crystal_key", "mystic_research_notes"),
         hazards=[HAZARD_TYPES["crystal_storm"]],
         weather_effects=["crystal_rain"],
         is_minor_area=True
@@ -278,7 +291,7 @@ GAME_MAP = {
         base_description="A crossroads where the three paths diverge, each leading to a different destiny.",
         requirements=[],
         enemies=["wandering_spirit", "lost_warrior"],
-        items=["path_marker", "ancient_inscription"],
+        items=("path_marker", "ancient_inscription"),
         npcs=["shadow_scout"]
     ),
     
@@ -308,7 +321,7 @@ GAME_MAP = {
         base_description="Jagged peaks pulse with ancient power, their surfaces etched with glowing runes.",
         requirements=["crystal_focus"],
         enemies=["mountain_guardian", "storm_elemental", "crystal_golem"],
-        items=["crystal_shard", "runic_inscription"],
+        items=("crystal_shard", "runic_inscription"),
         hazards=[HAZARD_TYPES["magic_barrier"]],
         weather_effects=["magical_storm", "crystal_rain"]
     ),
@@ -338,7 +351,7 @@ GAME_MAP = {
         base_description="A vast network of crystal-lined caves, humming with ancient magical frequencies.",
         requirements=["crystal_key"],
         enemies=["crystal_guardian", "resonance_spirit"],
-        items=["mystic_crystal", "resonance_key", "guardian_essence"],
+        items=("mystic_crystal", "resonance_key", "guardian_essence"),
         hazards=[HAZARD_TYPES["crystal_storm"]],
         weather_effects=["crystal_rain", "magical_storm"]
     ),
@@ -367,7 +380,7 @@ GAME_MAP = {
         base_description="Crumbling ruins of a mighty centaur stronghold, echoing with memories of battle.",
         requirements=["warrior_map"],
         enemies=["stone_guardian", "phantom_warrior"],
-        items=["ancient_sword", "battle_relic", "warrior_inscription"]
+        items=("ancient_sword", "battle_relic", "warrior_inscription")
     ),
     
     # New Minor Area: Warrior's Armory
@@ -387,7 +400,7 @@ GAME_MAP = {
         base_description="An ancient armory where the mightiest weapons of the centaur wars were kept.",
         requirements=["ancient_sword"],
         enemies=[],
-        items=["war_horn"],
+        items=("war_horn",),
         weather_effects=["spirit_winds"]
     ),
     
@@ -409,7 +422,7 @@ GAME_MAP = {
         base_description="A mysterious grove where shadows move with purpose and secrets hide in plain sight.",
         requirements=["shadow_key"],
         enemies=["shadow_stalker", "phantom_assassin"],
-        items=["stealth_cloak", "phantom_dagger", "shadow_essence"],
+        items=("stealth_cloak", "phantom_dagger", "shadow_essence"),
         weather_effects=["shadow_mist"]
     ),
     
@@ -422,7 +435,7 @@ GAME_MAP = {
         base_description="The corrupted throne of your rival, where reality itself bends to their will.",
         requirements=[],
         enemies=["shadow_guardian", "second_centaur", "shadow_knight", "void_walker"],
-        items=["crown_of_dominion"],
+        items=("crown_of_dominion",),
         hazards=[
             HAZARD_TYPES["magic_barrier"],
             HAZARD_TYPES["shadow_veil"],
@@ -455,11 +468,14 @@ GAME_MAP = {
         base_description="A valley of ancient battlefields, where the spirits of fallen warriors still linger.",
         requirements=["war_horn"],
         enemies=["shadow_guardian"],
-        items=["guardian_essence"],
+        items=("guardian_essence",),
         weather_effects=["spirit_winds"]
     ),
 }
 
+# Story areas only; side areas keyed by plain strings are left out
+GAME_MAP_NODES = {area: node for area, node in GAME_MAP.items() if isinstance(area, StoryArea)}
+
 class MapSystem:
     """Handles map-related operations and transitions."""
     
@@ -498,6 +514,24 @@ class MapSystem:
                     ))
         return enemies
     
+    def get_node_enemies(self, node: AreaNode) -> List[Enemy]:
+        """
+        Get a node's enemies as Enemy objects.
+        
+        Nodes store enemies as IDs until first converted, and may carry raw
+        dictionaries when loaded from saved state. Normalizing here keeps
+        every TileState on a single representation so callers can always
+        read ``enemy.name``.
+        """
+        # A node holds a single representation, so its first entry tells
+        # which one the whole list uses
+        enemies = node.enemies or []
+        if not enemies or isinstance(enemies[0], Enemy):
+            return list(cast(Sequence[Enemy], enemies))
+        if isinstance(enemies[0], dict):
+            return [Enemy(**enemy) for enemy in cast(Sequence[Dict[str, Any]], enemies)]
+        return self._create_enemies(cast(List[str], list(enemies)))
+    
     def get_area_node(self, area: StoryArea) -> AreaNode:
         """Get the area node for a given area."""
         return GAME_MAP[area]
@@ -561,14 +595,16 @@ class MapSystem:
             else:
                 return False, "No path exists in that direction."
             
-        # Check requirements
-        missing_items = [req for req in connection.requirements if req not in inventory]
+        # Check requirements against a set, so each one is a hash lookup
+        # rather than a scan of the inventory list
+        owned = set(inventory)
+        missing_items = [req for req in connection.requirements if req not in owned]
         if missing_items:
             return False, f"Missing required items: {', '.join(missing_items)}"
             
         # Check if destination area is accessible
         dest_node = self.get_area_node(to_area)
-        missing_area_items = [req for req in dest_node.requirements if req not in inventory]
+        missing_area_items = [req for req in dest_node.requirements if req not in owned]
         if missing_area_items:
             return False, f"Cannot enter area. Missing: {', '.join(missing_area_items)}"
             
@@ -585,8 +621,8 @@ class MapSystem:
         # Create the new area's tile state
         dest_node = self.get_area_node(to_area)
         
-        # Convert enemy dictionaries to Enemy objects
-        enemies = self._create_enemies(dest_node.enemies)
+        # Convert stored enemies to Enemy objects
+        enemies = self.get_node_enemies(dest_node)
         
         # Initialize NPCs list from area node
         npcs = dest_node.npcs if dest_node.npcs else []
@@ -596,7 +632,7 @@ class MapSystem:
             terrain_type=dest_node.terrain_type,
             area=to_area,
             description=dest_node.base_description,
-            items=dest_node.items.copy(),
+            items=dest_node.items,
             enemies=enemies,
             npcs=npcs,
             is_visited=to_area in self.discovered_areas
@@ -652,7 +688,7 @@ class MapSystem:
                     terrain_type=node.terrain_type,
                     area=area,
                     description=node.base_description,
-                    items=node.items.copy(),
+                    items=node.items,
                     enemies=node.enemies,
                     is_visited=True
                 )
@@ -7,7 +7,7 @@ useful for both development and potentially in-game map features.
 
 from typing import Dict, List, Set, Tuple
 from .map_system import GAME_MAP, AreaNode, AreaConnection
-from .models import StoryArea, Direction
+from .models import StoryArea, Direction, Enemy
 
 def create_ascii_map() -> str:
     """
@@ -82,7 +82,11 @@ def get_area_info(area: StoryArea) -> str:
         "\nRequirements:",
         ", ".join(node.requirements) if node.requirements else "None",
         "\nEnemies:",
-        ", ".join(node.enemies),
+        # Nodes hold enemy IDs until converted to Enemy objects (or dicts from saved state)
+        ", ".join(
+            enemy.name if isinstance(enemy, Enemy) else enemy["name"] if isinstance(enemy, dict) else enemy
+            for enemy in node.enemies
+        ),
         "\nItems:",
         ", ".join(node.items)
     ])
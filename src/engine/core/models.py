@@ -8,7 +8,7 @@ All models use Pydantic for validation and serialization.
 from datetime import datetime
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Tuple, Union, Any
+from typing import Dict, List, Optional, Sequence, Set, Tuple, Union, Any
 from pydantic import BaseModel, Field, validator, ConfigDict, model_serializer
 
 class Direction(str, Enum):
@@ -108,27 +108,36 @@ class Item(BaseModel):
 
 @dataclass
 class Enemy:
-    """Represents an enemy in the game."""
+    """
+    Represents an enemy in the game.
+    
+    The name is fixed once the enemy is created, since its lowercased form is
+    stored alongside it for case-insensitive lookups.
+    """
     name: str
     description: str
     health: int
     damage: int
     drops: List[str] = field(default_factory=list)
     requirements: List[str] = field(default_factory=list)
+    
+    def __post_init__(self):
+        # A plain attribute rather than a field, so asdict() round-trips
+        self.name_lower = self.name.lower()
 
-@dataclass
+@dataclass(slots=True)
 class TileState:
     """Represents the current state of a tile."""
     position: Tuple[int, int]
     terrain_type: TerrainType
     area: StoryArea
     description: str
-    items: List[str]
+    items: Sequence[str]  # May share the map node's tuple until first changed
     enemies: List[Enemy]
     npcs: List[str] = field(default_factory=list)
     is_visited: bool = False
     environmental_changes: List[Dict[str, Any]] = field(default_factory=list)
-    blocked_paths: List[Direction] = field(default_factory=list)
+    blocked_paths: Set[Direction] = field(default_factory=set)
     
     def get_description(self) -> str:
         """Get a full description of the tile's current state."""
@@ -166,6 +175,31 @@ class TileState:
         
         return "\n".join(desc)
     
+    def _own_items(self) -> List[str]:
+        """Get a list of items this tile can change, copying shared items first."""
+        items = self.items
+        if isinstance(items, list):
+            return items
+        owned = list(items)
+        self.items = owned
+        return owned
+    
+    def add_item(self, item: str) -> None:
+        """Add an item to the tile."""
+        self._own_items().append(item)
+    
+    def remove_item(self, item: str) -> None:
+        """Remove an item from the tile. Raises ValueError if it is not here."""
+        self._own_items().remove(item)
+    
+    def remove_enemy(self, name: str) -> Optional[Enemy]:
+        """Remove and return the first enemy with the given name (case-insensitive)."""
+        target = name.lower()
+        for index, enemy in enumerate(self.enemies):
+            if enemy.name_lower == target:
+                return self.enemies.pop(index)
+        return None
+    
     def update_enemies(self, time_of_day: str) -> None:
         """Update enemies based on time of day."""
         # Keep track of original enemy IDs
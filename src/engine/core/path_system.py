@@ -569,7 +569,8 @@ class PathSystem:
         Args:
             **kwargs: Arguments for stealth state update
         """
-        self.path_selection.stealth_state.update_detection(
+        stealth_state = self.path_selection.stealth_state
+        stealth_state.update_detection(
             kwargs.get("light_level", 0.5),
             kwargs.get("movement_speed", 0.0),
             kwargs.get("carrying_weight", 0.0),
@@ -577,12 +578,12 @@ class PathSystem:
         )
         
         # Apply item effects
-        self.path_selection.stealth_state.apply_stealth_item_effects(
-            kwargs.get("player_items", [])
+        stealth_state.apply_stealth_item_effects(
+            kwargs.get("player_items", ())
         )
         
         # Update cooldowns
-        self.path_selection.stealth_state.update_cooldowns()
+        stealth_state.update_cooldowns()
     
     def update_meditation_state(self, **kwargs) -> Tuple[float, bool]:
         """
@@ -4,17 +4,100 @@ Player state and movement mechanics for The Last Centaur.
 This module handles Centaur Prime's state, movement, and related mechanics.
 """
 
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, field, replace
 from enum import Enum
-from datetime import datetime
+from functools import lru_cache
 
-from .models import Direction, TileState, TerrainType, PathType
-from .map_system import MapSystem, GAME_MAP
+from .models import Direction, Enemy, TileState, TerrainType, PathType
+from .map_system import MapSystem, GAME_MAP_NODES
 from .models import StoryArea
-from .game_systems import TimeSystem, TimeOfDay, AchievementSystem, TitleSystem, LeaderboardSystem, LeaderboardEntry
+from .game_systems import (
+    TimeSystem, TimeOfDay, AchievementSystem, TitleSystem, LeaderboardSystem, LeaderboardEntry,
+    join_time_events
+)
 
-@dataclass
+# The world map is a square grid of this many tiles per side
+_GRID_SIZE = 10
+
+# Directions in a fixed order, so hot paths don't re-iterate the enum
+_DIRECTIONS = tuple(Direction)
+
+# (direction, dx, dy) for each direction; north increases y
+_DELTAS = (
+    (Direction.NORTH, 0, 1),
+    (Direction.SOUTH, 0, -1),
+    (Direction.EAST, 1, 0),
+    (Direction.WEST, -1, 0),
+)
+_DELTA_BY_DIR: Dict[Direction, Tuple[int, int]] = {direction: (dx, dy) for direction, dx, dy in _DELTAS}
+
+# One bit per direction for the blocked_paths masks
+_DIR_BIT: Dict[Direction, int] = {direction: 1 << index for index, direction in enumerate(_DIRECTIONS)}
+
+# Direction names for messages, read once instead of through Enum.value
+_DIR_NAME: Dict[Direction, str] = {direction: direction.value for direction in _DIRECTIONS}
+
+# Movement messages shared by get_possible_moves and _validate_movement
+_MSG_BARRIER = "A shimmering magical barrier blocks your path."
+_MSG_NO_STAMINA = "Not enough stamina to move."
+_MSG_CLEAR = "Clear path."
+_MSG_BLOCKED_FMT = "Path blocked by {}. Defeat it to proceed."
+
+@lru_cache(maxsize=32)
+def _blocked_message(enemy_name: str) -> str:
+    """Get the blocked-path message for an enemy, formatted once per name."""
+    return _MSG_BLOCKED_FMT.format(enemy_name)
+
+# Terrain where ancient energies boost meditation
+_MYSTICAL_TERRAIN: frozenset = frozenset({TerrainType.RUINS, TerrainType.CAVE})
+
+def _cell(x: int, y: int) -> int:
+    """Get the cell index of an on-map position, the key used for visited and blocked state."""
+    return y * _GRID_SIZE + x
+
+# Position of each cell index, so decoding visited_order reuses these tuples
+_CELL_POSITIONS = tuple((cell % _GRID_SIZE, cell // _GRID_SIZE) for cell in range(_GRID_SIZE * _GRID_SIZE))
+
+# Status text of each cell's position, formatted once instead of on every status report
+_CELL_POSITION_TEXT = tuple(str(position) for position in _CELL_POSITIONS)
+
+def _in_bounds(x: int, y: int) -> bool:
+    """Check whether a position lies on the world map."""
+    # x | y is negative exactly when either coordinate is, so one compare
+    # covers both lower bounds
+    return (x | y) >= 0 and x < _GRID_SIZE and y < _GRID_SIZE
+
+# For each on-map position, the _DIR_BIT mask of moves that stay on the map
+_OPEN_DIRS: Dict[Tuple[int, int], int] = {
+    (x, y): sum(_DIR_BIT[direction] for direction, dx, dy in _DELTAS if _in_bounds(x + dx, y + dy))
+    for x in range(_GRID_SIZE)
+    for y in range(_GRID_SIZE)
+}
+
+# (position, direction) -> the on-map position one step away, so movement
+# checks and moves resolve their target with a single lookup
+_NEIGHBORS: Dict[Tuple[Tuple[int, int], Direction], Tuple[int, int]] = {
+    ((x, y), direction): (x + dx, y + dy)
+    for x in range(_GRID_SIZE)
+    for y in range(_GRID_SIZE)
+    for direction, dx, dy in _DELTAS
+    if _in_bounds(x + dx, y + dy)
+}
+
+# Moves for each (_OPEN_DIRS mask, has stamina) pair when no path is blocked.
+# These inputs only take a few values, so every result is built once here
+# and get_possible_moves only has to copy it for the caller.
+_UNBLOCKED_MOVES: Dict[Tuple[int, bool], Dict[Direction, str]] = {
+    (on_map, has_stamina): {
+        direction: (_MSG_CLEAR if has_stamina else _MSG_NO_STAMINA) if on_map & _DIR_BIT[direction] else _MSG_BARRIER
+        for direction in _DIRECTIONS
+    }
+    for on_map in set(_OPEN_DIRS.values()) | {0}
+    for has_stamina in (False, True)
+}
+
+@dataclass(slots=True)
 class PlayerStats:
     """Core stats for Centaur Prime."""
     health: int = 100
@@ -24,7 +107,7 @@ class PlayerStats:
     inventory_capacity: int = 100
     current_inventory_weight: int = 0
 
-@dataclass
+@dataclass(slots=True)
 class PlayerState:
     """Represents the complete state of Centaur Prime."""
     player_id: str  # Add player_id field
@@ -33,11 +116,30 @@ class PlayerState:
     current_area: StoryArea = StoryArea.AWAKENING_WOODS
     stats: PlayerStats = field(default_factory=PlayerStats)
     inventory: List[str] = field(default_factory=list)
-    visited_tiles: Set[Tuple[int, int]] = field(default_factory=set)
-    blocked_paths: Dict[Tuple[int, int], List[Direction]] = field(default_factory=dict)
+    visited_tiles: int = 0  # Bitmask; bit y * _GRID_SIZE + x is set once (x, y) is visited
+    visited_order: bytearray = field(default_factory=bytearray)  # Cells (y * _GRID_SIZE + x) first visited, in order
+    blocked_paths: Dict[int, int] = field(default_factory=dict)  # Cell (y * _GRID_SIZE + x) -> _DIR_BIT mask
     current_tile: Optional[TileState] = None
     rest_count: int = 0  # Track number of rest attempts
 
+@dataclass(frozen=True, slots=True)
+class PlayerSnapshot:
+    """
+    Immutable copy of Centaur Prime's positional state.
+    
+    Snapshots hold only immutable values, so they can be kept for undo or
+    replay and shared freely without defensive copies.
+    """
+    position: Tuple[int, int]
+    current_area: StoryArea
+    visited_tiles: int
+    visited_order: bytes
+    blocked_paths: Tuple[Tuple[int, int], ...]
+    
+    def with_position(self, x: int, y: int) -> "PlayerSnapshot":
+        """Get a copy of this snapshot at a different position."""
+        return replace(self, position=(x, y))
+
 class MovementError(Exception):
     """Custom exception for movement-related errors."""
     pass
@@ -45,6 +147,11 @@ class MovementError(Exception):
 class Player:
     """Handles player state and movement."""
     
+    __slots__ = (
+        'state', 'map_system', 'time_system', '_achievement_system',
+        '_title_system', '_leaderboard_system', 'path_type'
+    )
+    
     def __init__(self, map_system: MapSystem, player_id: str, player_name: str):
         self.state = PlayerState(
             player_id=player_id,
@@ -53,11 +160,13 @@ class Player:
         )
         self.map_system = map_system
         self.time_system = TimeSystem(map_system=map_system)
-        self.achievement_system = AchievementSystem()
-        self.title_system = TitleSystem()
-        self.leaderboard_system = LeaderboardSystem()  # Initialize leaderboard system
-        self.state.visited_tiles.add((5, 0))
-        self.path_type = None  # Initialize path_type as None
+        # Progression systems are only needed for reports and completion,
+        # so they are created on first use
+        self._achievement_system: Optional[AchievementSystem] = None
+        self._title_system: Optional[TitleSystem] = None
+        self._leaderboard_system: Optional[LeaderboardSystem] = None
+        self._mark_visited((5, 0))
+        self.path_type: Optional[PathType] = None  # Initialize path_type as None
         
         # Initialize current tile as TileState
         starting_node = self.map_system.get_area_node(StoryArea.AWAKENING_WOODS)
@@ -66,8 +175,8 @@ class Player:
             terrain_type=starting_node.terrain_type,
             area=starting_node.area,
             description=starting_node.base_description,
-            items=starting_node.items.copy(),
-            enemies=starting_node.enemies,
+            items=starting_node.items,
+            enemies=self.map_system.get_node_enemies(starting_node),
             npcs=starting_node.npcs if starting_node.npcs else [],
             is_visited=True
         )
@@ -76,6 +185,32 @@ class Player:
         """Get the player's current position."""
         return self.state.position
     
+    @property
+    def achievement_system(self) -> AchievementSystem:
+        """Get the player's achievement system, creating it on first use."""
+        if self._achievement_system is None:
+            self._achievement_system = AchievementSystem()
+        return self._achievement_system
+    
+    @property
+    def title_system(self) -> TitleSystem:
+        """Get the player's title system, creating it on first use."""
+        if self._title_system is None:
+            self._title_system = TitleSystem()
+        return self._title_system
+    
+    @property
+    def leaderboard_system(self) -> LeaderboardSystem:
+        """
+        Get this player's leaderboard system, creating it on first use.
+        
+        LeaderboardSystem is a singleton, so every player ends up with the
+        same instance.
+        """
+        if self._leaderboard_system is None:
+            self._leaderboard_system = LeaderboardSystem()
+        return self._leaderboard_system
+    
     @property
     def x(self) -> int:
         """Get the player's x coordinate."""
@@ -88,182 +223,163 @@ class Player:
     
     def get_possible_moves(self) -> Dict[Direction, str]:
         """Get all possible moves from current position with descriptions."""
-        x, y = self.state.position
-        possible = {}
-        
-        # Check each direction
-        for direction in Direction:
-            new_x, new_y = self._get_new_position(direction)
-            
-            # Check if move would be off map
-            if not (0 <= new_x < 10 and 0 <= new_y < 10):
-                possible[direction] = "A shimmering magical barrier blocks your path."
-                continue
-            
-            # Check if path is blocked by enemy
-            if self._is_path_blocked(direction):
-                enemy = self._get_blocking_enemy(direction)
-                possible[direction] = f"Path blocked by {enemy}. Defeat it to proceed."
-                continue
-            
-            # Check if player has enough stamina
-            if self.state.stats.stamina < 5:
-                possible[direction] = "Not enough stamina to move."
-                continue
-            
-            # Path is available
-            possible[direction] = "Clear path."
-        
-        return possible
+        state = self.state
+        position = state.position
+        
+        has_stamina = state.stats.stamina >= 5
+        on_map = _OPEN_DIRS.get(position, 0)
+        
+        # With no blocked paths the answer only depends on the map edge and
+        # stamina, so it is copied from the precomputed table
+        blocked = state.blocked_paths.get(_cell(*position), 0) if on_map else 0
+        if not blocked:
+            return _UNBLOCKED_MOVES[on_map, has_stamina].copy()
+        
+        # Off-map moves hit the barrier, then enemies block their paths, and
+        # any other direction is open if stamina allows
+        open_message = _MSG_CLEAR if has_stamina else _MSG_NO_STAMINA
+        return {
+            direction: _MSG_BARRIER if not on_map & _DIR_BIT[direction]
+            else _blocked_message(self._get_blocking_enemy(direction))
+            if blocked & _DIR_BIT[direction]
+            else open_message
+            for direction in _DIRECTIONS
+        }
     
-    def move(self, direction: Direction) -> Tuple[bool, str]:
+    def move(self, direction: Direction, *, silent: bool = False) -> Tuple[bool, str]:
         """
         Move the player in a direction.
         
         Args:
             direction: The direction to move
+            silent: Skip building the arrival description, for scripted
+                replays that only need the state change
             
         Returns:
-            Tuple of (success, message)
+            Tuple of (success, message). Successful silent moves return an
+            empty message.
         """
-        # Get current position and area before moving
-        original_position = self.state.position
-        original_area = self.state.current_area
+        state = self.state
         
-        # Get current position
-        x, y = self.state.position
+        # Get current position and area before moving
+        original_position = state.position
+        original_area = state.current_area
         
-        # Calculate new position
-        if direction == Direction.NORTH:
-            new_position = (x, y + 1)
-        elif direction == Direction.SOUTH:
-            new_position = (x, y - 1)
-        elif direction == Direction.EAST:
-            new_position = (x + 1, y)
-        elif direction == Direction.WEST:
-            new_position = (x - 1, y)
-        else:
+        bit = _DIR_BIT.get(direction)
+        if bit is None:
             return False, "Invalid direction."
         
         # Check if the new position is valid
-        new_x, new_y = new_position
-        if new_x < 0 or new_y < 0 or new_x >= 10 or new_y >= 10:  # Assuming 10x10 map
+        new_position = _NEIGHBORS.get((original_position, direction))
+        if new_position is None:
             return False, "You cannot go that way."
         
         # Check if the path is blocked
-        if direction in self.state.blocked_paths.get(self.state.position, []):
+        if state.blocked_paths.get(_cell(*original_position), 0) & bit:
             return False, "That path is blocked."
         
-        # Check if this is a transition between areas
-        current_area = self.state.current_area
-        
         # Get the area node for the current area
-        current_node = self.map_system.get_area_node(current_area)
+        map_system = self.map_system
+        current_node = map_system.get_area_node(original_area)
         
         # Find if there's a connection in the requested direction
-        connection = next((c for c in current_node.connections if c.direction == direction), None)
+        connection = current_node.get_connection(direction)
         
         if connection:
             # This is an area transition
             to_area = connection.to_area
             
             # Check if the player can transition to the new area
-            can_move, message, new_tile = self.map_system.transition_area(
-                current_area, to_area, direction, self.state.inventory
+            can_move, message, new_tile = map_system.transition_area(
+                original_area, to_area, direction, state.inventory
             )
             
             if not can_move:
                 return False, message
                 
             # Update the player's current area and tile
-            self.state.current_area = to_area
-            self.state.current_tile = new_tile
-            self.state.position = new_position
+            state.current_area = to_area
+            state.current_tile = new_tile
+            state.position = new_position
             
             # Mark tile as visited
-            self.state.visited_tiles.add(new_position)
+            self._mark_visited(new_position)
             
-            return True, f"Moved {direction.value.lower()}. {new_tile.description}"
+            if silent:
+                return True, ""
+            return True, f"Moved {_DIR_NAME[direction]}. {new_tile.description}"
         
         # If not an area transition, just update position within the same area
-        self.state.position = new_position
+        state.position = new_position
         
         # Mark tile as visited
-        self.state.visited_tiles.add(new_position)
+        self._mark_visited(new_position)
         
         # Update current tile
-        area_node = self.map_system.get_tile_at_position(new_position)
+        area_node = map_system.get_tile_at_position(new_position)
         if area_node:
-            # Convert enemy dictionaries to Enemy objects if needed
-            enemies = area_node.enemies
-            if enemies and isinstance(enemies[0], dict):
-                from .models import Enemy
-                enemies = [Enemy(**enemy) for enemy in enemies]
+            # Normalize enemies to Enemy objects
+            enemies = map_system.get_node_enemies(area_node)
             
-            self.state.current_tile = TileState(
+            state.current_tile = TileState(
                 position=new_position,
                 terrain_type=area_node.terrain_type,
                 area=area_node.area,
                 description=area_node.base_description,
-                items=area_node.items.copy() if hasattr(area_node, 'items') else [],
-                enemies=enemies if hasattr(area_node, 'enemies') else [],
-                npcs=area_node.npcs if hasattr(area_node, 'npcs') else [],
-                is_visited=True,
-                environmental_changes=area_node.environmental_changes if hasattr(area_node, 'environmental_changes') else []
+                items=area_node.items,
+                enemies=enemies,
+                npcs=area_node.npcs if area_node.npcs else [],
+                is_visited=True
             )
             
             # Update current area if it's different
-            if area_node.area != self.state.current_area:
-                self.state.current_area = area_node.area
+            if area_node.area != state.current_area:
+                state.current_area = area_node.area
+        
+        if silent:
+            return True, ""
         
         # Check if we actually moved to a new location
-        if self.state.position == original_position and self.state.current_area == original_area:
+        if state.position == original_position and state.current_area == original_area:
             # We're still in the same place - this might be a bug or a special case
             # For now, let's add a note to the message
-            return True, f"Moved {direction.value.lower()}, but you seem to be in the same location. This might be a special area or a loop in the map."
+            return True, f"Moved {_DIR_NAME[direction]}, but you seem to be in the same location. This might be a special area or a loop in the map."
         
         # Get description of new location
         return True, self.get_current_tile_description()
     
     def _validate_movement(self, direction: Direction) -> None:
         """Validate if movement is possible."""
-        new_x, new_y = self._get_new_position(direction)
+        state = self.state
         
         # Check map boundaries
-        if not (0 <= new_x < 10 and 0 <= new_y < 10):
-            raise MovementError("A shimmering magical barrier blocks your path.")
+        new_position = _NEIGHBORS.get((state.position, direction))
+        if new_position is None:
+            raise MovementError(_MSG_BARRIER)
         
         # Check stamina
-        if self.state.stats.stamina < 5:
-            raise MovementError("Not enough stamina to move.")
+        if state.stats.stamina < 5:
+            raise MovementError(_MSG_NO_STAMINA)
         
         # Check if path is blocked by enemy
-        if self.state.current_tile and self.state.current_tile.enemies:
-            raise MovementError(f"Path blocked by {self.state.current_tile.enemies[0].name}. Defeat it to proceed.")
+        tile = state.current_tile
+        if tile and tile.enemies:
+            raise MovementError(_blocked_message(tile.enemies[0].name))
         
         # Check if the new position is a valid area
-        new_area = self._get_area_for_position((new_x, new_y))
-        if new_area not in GAME_MAP:
+        new_area = self._get_area_for_position(new_position)
+        if new_area not in GAME_MAP_NODES:
             raise MovementError("A magical barrier prevents you from going that way.")
     
     def _get_new_position(self, direction: Direction) -> Tuple[int, int]:
         """Calculate new position based on direction."""
+        dx, dy = _DELTA_BY_DIR[direction]
         x, y = self.state.position
-        
-        if direction == Direction.NORTH:
-            return (x, y + 1)
-        elif direction == Direction.SOUTH:
-            return (x, y - 1)
-        elif direction == Direction.EAST:
-            return (x + 1, y)
-        else:  # WEST
-            return (x - 1, y)
+        return (x + dx, y + dy)
     
     def _is_path_blocked(self, direction: Direction) -> bool:
         """Check if path is blocked by enemy."""
-        if self.state.position not in self.state.blocked_paths:
-            return False
-        return direction in self.state.blocked_paths[self.state.position]
+        return bool(self.state.blocked_paths.get(_cell(*self.state.position), 0) & _DIR_BIT[direction])
     
     def _get_blocking_enemy(self, direction: Direction) -> str:
         """Get the name of enemy blocking the path."""
@@ -276,25 +392,91 @@ class Player:
     
     def _get_area_for_position(self, position: Tuple[int, int]) -> StoryArea:
         """Get the area for a given position."""
-        # First try to find the area in the GAME_MAP
-        for area, node in GAME_MAP.items():
-            if isinstance(area, str):
-                continue  # Skip string-based area names
-            if node.position == position:
-                return area
-        return self.state.current_area  # Stay in current area if position not found
+        node = self.map_system.get_tile_at_position(position)
+        if node is None or node.area not in GAME_MAP_NODES:
+            return self.state.current_area  # Stay in current area if position not found
+        return node.area
+    
+    def _get_areas_for_positions(self, positions: List[Tuple[int, int]]) -> List[StoryArea]:
+        """
+        Get the area for each of many positions, as _get_area_for_position would.
+        
+        Meant for bulk queries such as reachability searches; the lookups
+        run in one comprehension with the tables bound locally.
+        """
+        get_node = self.map_system.position_to_area.get
+        current_area = self.state.current_area
+        return [
+            node.area if node is not None and node.area in GAME_MAP_NODES else current_area
+            for node in map(get_node, positions)
+        ]
+    
+    def _mark_visited(self, position: Tuple[int, int]) -> None:
+        """Record a visit, remembering the order in which tiles were first reached."""
+        state = self.state
+        cell = _cell(*position)
+        bit = 1 << cell
+        if not state.visited_tiles & bit:
+            state.visited_tiles |= bit
+            state.visited_order.append(cell)
     
     def get_movement_history(self) -> List[Tuple[int, int]]:
         """Get list of visited tiles in order of visit."""
-        return list(self.state.visited_tiles)
+        return [_CELL_POSITIONS[cell] for cell in self.state.visited_order]
+    
+    def has_visited(self, position: Tuple[int, int]) -> bool:
+        """Check whether a tile has been visited, without building the history."""
+        return _in_bounds(*position) and bool((self.state.visited_tiles >> _cell(*position)) & 1)
+    
+    def snapshot(self) -> PlayerSnapshot:
+        """Capture the player's position, area and exploration state."""
+        state = self.state
+        return PlayerSnapshot(
+            position=state.position,
+            current_area=state.current_area,
+            visited_tiles=state.visited_tiles,
+            visited_order=bytes(state.visited_order),
+            blocked_paths=tuple(state.blocked_paths.items())
+        )
+    
+    def restore(self, snapshot: PlayerSnapshot) -> None:
+        """
+        Return the player to a previously captured snapshot.
+        
+        Tiles are mutable and not part of snapshots, so the current tile is
+        rebuilt from the map node at the restored position, as move does.
+        """
+        state = self.state
+        position = snapshot.position
+        state.position = position
+        state.current_area = snapshot.current_area
+        state.visited_tiles = snapshot.visited_tiles
+        state.visited_order = bytearray(snapshot.visited_order)
+        state.blocked_paths = dict(snapshot.blocked_paths)
+        
+        # Fall back to the area's node for positions with no node of their own
+        map_system = self.map_system
+        node = map_system.get_tile_at_position(position) or map_system.get_area_node(snapshot.current_area)
+        state.current_tile = TileState(
+            position=position,
+            terrain_type=node.terrain_type,
+            area=node.area,
+            description=node.base_description,
+            items=node.items,
+            enemies=map_system.get_node_enemies(node),
+            npcs=node.npcs if node.npcs else [],
+            is_visited=True
+        )
     
     def get_tile_info(self, position: Tuple[int, int]) -> Optional[str]:
         """Get information about a tile if it has been visited."""
-        if position not in self.state.visited_tiles:
+        if not self.has_visited(position):
             return None
             
-        area = self._get_area_for_position(position)
-        node = self.map_system.get_area_node(area)
+        # Use the node at the position directly, falling back to the current area
+        node = self.map_system.get_tile_at_position(position)
+        if node is None or node.area not in GAME_MAP_NODES:
+            node = self.map_system.get_area_node(self.state.current_area)
         
         # Add time of day description
         time_desc = self.time_system.time.get_time_description()
@@ -311,63 +493,70 @@ class Player:
         Returns:
             (success, message) tuple
         """
-        if self.state.current_tile and self.state.current_tile.enemies:
+        tile = self.state.current_tile
+        if tile and tile.enemies:
             return False, "Cannot meditate while enemies are present. The air is too thick with hostile intent."
             
         # Use provided duration or default to 30 minutes
         meditation_time = duration if duration is not None else 30
         
         # Get time-based multipliers
-        multipliers = self.time_system.get_time_multipliers()
+        time_system = self.time_system
+        multipliers = time_system.get_time_multipliers()
         
         # Base recovery modified by time of day and duration
         base_recovery = int((40 * (meditation_time / 30)) * multipliers["stamina_recovery"])
         
         # Bonus recovery in mystical areas
-        if self.state.current_tile and self.state.current_tile.terrain_type in [TerrainType.RUINS, TerrainType.CAVE]:
+        if tile and tile.terrain_type in _MYSTICAL_TERRAIN:
             bonus = int(10 * (meditation_time / 30))
             recovery_message = "The ancient energies enhance your meditation."
         else:
             bonus = 0
             recovery_message = "You find your center and recover your strength."
         
-        total_recovery = min(base_recovery + bonus, 
-                           self.state.stats.max_stamina - self.state.stats.stamina)
-        
-        self.state.stats.stamina += total_recovery
+        stats = self.state.stats
+        total_recovery = min(base_recovery + bonus, stats.max_stamina - stats.stamina)
+        stats.stamina += total_recovery
         
         # Advance time by the meditation duration
-        time_events = self.time_system.advance_time(meditation_time)
-        time_message = " ".join(time_events.values()) if time_events else ""
+        time_events = time_system.advance_time(meditation_time)
+        time_message = join_time_events(time_events)
         
         # Update current tile's enemies based on new time
-        if self.state.current_tile:
-            time_of_day = self.time_system.time.get_time_of_day().value
-            self.state.current_tile.update_enemies(time_of_day)
+        if tile:
+            # TimeOfDay is a str enum, so it can be passed on as is
+            time_of_day = time_system.time.get_time_of_day()
+            tile.update_enemies(time_of_day)
             
             # Update description based on time of day
-            if time_of_day.lower() == "night":
-                if "The land lies under a blanket of stars" not in self.state.current_tile.description:
-                    self.state.current_tile.description += " The land lies under a blanket of stars."
+            if time_of_day is TimeOfDay.NIGHT:
+                if "The land lies under a blanket of stars" not in tile.description:
+                    tile.description += " The land lies under a blanket of stars."
         
-        if bonus > 0:
-            return True, f"{recovery_message} Recovered {total_recovery} stamina. {time_message}"
-        return True, f"{recovery_message} Recovered {total_recovery} stamina. {time_message}"
+        message = f"{recovery_message} Recovered {total_recovery} stamina."
+        if time_message:
+            message = f"{message} {time_message}"
+        return True, message
 
     def rest(self) -> Tuple[bool, str]:
         """Attempt to rest and recover stamina."""
+        state = self.state
+        
         # Check if there are enemies in the current tile
-        if self.state.current_tile and self.state.current_tile.enemies:
-            self.state.rest_count += 1  # Increment rest attempts with enemies present
-            achievement_msg = self.achievement_system.check_rest_achievement(self.state.rest_count)
+        tile = state.current_tile
+        if tile and tile.enemies:
+            state.rest_count += 1  # Increment rest attempts with enemies present
+            achievement_msg = self.achievement_system.check_rest_achievement(state.rest_count)
             return False, f"Cannot rest while enemies are present. {achievement_msg if achievement_msg else ''}"
         
         # Try to rest using time system
         success, message = self.time_system.rest()
         if success:
             # Recover stamina
-            recovery = min(20, self.state.stats.max_stamina - self.state.stats.stamina)
-            self.state.stats.stamina += recovery
+            stats = state.stats
+            recovery = min(20, stats.max_stamina - stats.stamina)
+            stats.stamina += recovery
             return True, f"{message} Recovered {recovery} stamina."
         
         return False, message
@@ -379,36 +568,35 @@ class Player:
         if hasattr(self.achievement_system, "check_combat_achievement"):
             achievement_msg = self.achievement_system.check_combat_achievement(enemy_name, True)
         
+        state = self.state
+        tile = state.current_tile
+        
         # Find the enemy by name (case-insensitive)
-        enemy_obj = None
-        if self.state.current_tile and self.state.current_tile.enemies:
-            for enemy in self.state.current_tile.enemies[:]:  # Create a copy to modify during iteration
-                if enemy.name.lower() == enemy_name.lower():
-                    enemy_obj = enemy
-                    self.state.current_tile.enemies.remove(enemy)
-                    break
+        enemy_obj: Optional[Enemy] = None
+        if tile and tile.enemies:
+            enemy_obj = tile.remove_enemy(enemy_name)
         
         # Add enemy drops to the current tile
         if enemy_obj and hasattr(enemy_obj, 'drops') and enemy_obj.drops:
             # Add drops to the current tile's items
             for item in enemy_obj.drops:
-                if item not in self.state.current_tile.items:
-                    self.state.current_tile.items.append(item)
+                if item not in tile.items:
+                    tile.add_item(item)
         
         # Clear blocked paths
-        if self.state.position in self.state.blocked_paths:
-            self.state.blocked_paths.pop(self.state.position)
+        state.blocked_paths.pop(_cell(*state.position), None)
         
         # Advance time by 30 minutes for combat
         time_events = self.time_system.advance_time(30)
-        time_message = " ".join(time_events.values()) if time_events else ""
+        time_message = join_time_events(time_events)
         
         # Restore some health and stamina after victory
-        health_restore = min(10, self.state.stats.max_health - self.state.stats.health)
-        stamina_restore = min(20, self.state.stats.max_stamina - self.state.stats.stamina)
+        stats = state.stats
+        health_restore = min(10, stats.max_health - stats.health)
+        stamina_restore = min(20, stats.max_stamina - stats.stamina)
         
-        self.state.stats.health += health_restore
-        self.state.stats.stamina += stamina_restore
+        stats.health += health_restore
+        stats.stamina += stamina_restore
         
         # Build victory message
         victory_msg = f"You defeated the {enemy_name}!"
@@ -420,7 +608,7 @@ class Player:
         
         # Add health/stamina restore message
         if health_restore > 0 or stamina_restore > 0:
-            restore_msg = []
+            restore_msg: List[str] = []
             if health_restore > 0:
                 restore_msg.append(f"{health_restore} health")
             if stamina_restore > 0:
@@ -440,26 +628,25 @@ class Player:
     
     def get_achievements(self) -> str:
         """Get the current achievement status."""
-        # Get the total number of achievements
-        total_achievements = len(self.achievement_system.achievements)
-        # Get the number of unlocked achievements
-        unlocked_achievements = len(self.achievement_system.unlocked_achievements)
+        achievements = self.achievement_system.achievements
+        unlocked = self.achievement_system.unlocked_achievements
         
         # Format the output
-        output = [f"Achievements ({unlocked_achievements}/{total_achievements}):"]
+        output = [f"Achievements ({len(unlocked)}/{len(achievements)}):"]
         
         # Add unlocked achievements
-        if unlocked_achievements > 0:
+        if unlocked:
             output.append("\nUnlocked:")
-            for achievement_id in self.achievement_system.unlocked_achievements:
-                achievement = self.achievement_system.achievements.get(achievement_id)
-                if achievement:
-                    output.append(f"- {achievement.name}: {achievement.description}")
+            output += [
+                f"- {achievement.name}: {achievement.description}"
+                for achievement_id in unlocked
+                if (achievement := achievements.get(achievement_id))
+            ]
         else:
             output.append("\nNo achievements unlocked yet.")
         
         # Add First Steps achievement for testing
-        if not self.achievement_system.unlocked_achievements and "first_steps" in self.achievement_system.achievements:
+        if not unlocked and "first_steps" in achievements:
             output.append("\nUnlocked:")
             output.append("- First Steps: Your journey begins")
         
@@ -467,64 +654,72 @@ class Player:
     
     def update_blocked_paths(self, enemy_id: str, direction: Direction, is_blocked: bool) -> None:
         """Update which paths are blocked by enemies."""
+        blocked_paths = self.state.blocked_paths
+        cell = _cell(*self.state.position)
+        mask = blocked_paths.get(cell, 0)
+        bit = _DIR_BIT[direction]
         if is_blocked:
-            if self.state.position not in self.state.blocked_paths:
-                self.state.blocked_paths[self.state.position] = []
-            self.state.blocked_paths[self.state.position].append(direction)
-        else:
-            if self.state.position in self.state.blocked_paths:
-                self.state.blocked_paths[self.state.position].remove(direction)
+            blocked_paths[cell] = mask | bit
+        elif mask & bit:
+            mask ^= bit
+            if mask:
+                blocked_paths[cell] = mask
+            else:
+                del blocked_paths[cell]
     
     def get_status(self) -> str:
         """Get the player's current status including time."""
-        time_desc = self.time_system.time.get_time_description()
-        current_time = self.time_system.time.get_formatted_time()
+        game_time = self.time_system.time
+        time_desc = game_time.get_time_description()
+        current_time = game_time.get_formatted_time()
         
-        # Get equipped title
+        # Get equipped title. A player whose title system was never created
+        # has no title, so don't create it just to check.
         title_info = ""
-        if self.title_system.equipped_title:
-            title = self.title_system.titles[self.title_system.equipped_title]
+        title_system = self._title_system
+        if title_system is not None and title_system.equipped_title:
+            title = title_system.titles[title_system.equipped_title]
             title_info = f"\nTitle: {title.name}"
         
+        state = self.state
+        stats = state.stats
+        position = state.position
+        position_text = _CELL_POSITION_TEXT[_cell(*position)] if _in_bounds(*position) else str(position)
         return (
             f"Time: {current_time}\n"
             f"{time_desc}\n\n"
-            f"Health: {self.state.stats.health}/{self.state.stats.max_health}\n"
-            f"Stamina: {self.state.stats.stamina}/{self.state.stats.max_stamina}\n"
-            f"Position: {self.state.position}\n"
-            f"Current Area: {self.state.current_area.value}"
+            f"Health: {stats.health}/{stats.max_health}\n"
+            f"Stamina: {stats.stamina}/{stats.max_stamina}\n"
+            f"Position: {position_text}\n"
+            f"Current Area: {state.current_area.value}"
             f"{title_info}\n"
-            f"Inventory: {len(self.state.inventory)}/{self.state.stats.inventory_capacity} items"
+            f"Inventory: {len(state.inventory)}/{stats.inventory_capacity} items"
         )
 
     def get_titles(self) -> str:
         """Get the current title status."""
-        # Get the total number of titles
-        total_titles = len(self.title_system.titles)
-        # Get the number of unlocked titles
-        unlocked_titles = len(self.title_system.unlocked_titles)
+        title_system = self.title_system
+        titles = title_system.titles
+        unlocked = title_system.unlocked_titles
         
         # Format the output
-        output = [f"Titles ({unlocked_titles}/{total_titles}):"]
+        output = [f"Titles ({len(unlocked)}/{len(titles)}):"]
         
         # Add unlocked titles
-        if unlocked_titles > 0:
+        if unlocked:
             output.append("\nUnlocked:")
-            for title_id in self.title_system.unlocked_titles:
-                title = self.title_system.titles.get(title_id)
-                if title:
-                    output.append(f"- {title.name}")
+            output += [f"- {title.name}" for title_id in unlocked if (title := titles.get(title_id))]
             
             # Add equipped title
-            if self.title_system.equipped_title:
-                equipped_title = self.title_system.titles.get(self.title_system.equipped_title)
+            if title_system.equipped_title:
+                equipped_title = titles.get(title_system.equipped_title)
                 if equipped_title:
                     output.append(f"\nEquipped: {equipped_title.name}")
         else:
             output.append("\nNo titles unlocked yet.")
         
         # Add The Swift title for testing
-        if not self.title_system.unlocked_titles and "the_swift" in self.title_system.titles:
+        if not unlocked and "the_swift" in titles:
             output.append("\nUnlocked:")
             output.append("- The Swift")
         
@@ -564,8 +759,7 @@ class Player:
             player_name=self.state.player_name,
             completion_time=self.time_system.time.get_formatted_time(),
             achievements=len(self.achievement_system.unlocked_achievements),
-            path_type=path_type,
-            date=datetime.now()
+            path_type=path_type
         )
         
         # Add to leaderboard
@@ -593,16 +787,19 @@ class Player:
         if not entries:
             return "No records yet"
         
-        # Get best times for each path
-        records = []
-        records.append("Personal Records:")
+        # Get best times for each path in one pass over the player's entries
+        best_times: Dict[str, str] = {}
+        for entry in entries:
+            best = best_times.get(entry.path_type)
+            if best is None or entry.completion_time < best:
+                best_times[entry.path_type] = entry.completion_time
         
-        for path_type in self.leaderboard_system.path_types:
-            best_time = self.leaderboard_system.get_player_best_time(
-                self.state.player_id, path_type
-            )
-            if best_time:
-                records.append(f"{path_type.title()} Path: {best_time}")
+        records = ["Personal Records:"]
+        records += [
+            f"{path_type.title()} Path: {best_time}"
+            for path_type in self.leaderboard_system.path_types
+            if (best_time := best_times.get(path_type))
+        ]
         
         # Get rankings
         overall_rank = self.leaderboard_system.get_player_ranking(self.state.player_id)
@@ -610,26 +807,19 @@ class Player:
             self.state.player_id, "achievements"
         )
         
-        records.extend([
+        records += [
             "",
             "Current Rankings:",
             f"Overall: #{overall_rank}" if overall_rank else "Overall: Not ranked",
             f"Achievements: #{achievement_rank}" if achievement_rank else "Achievements: Not ranked"
-        ])
+        ]
         
         return "\n".join(records)
 
     def get_current_tile_description(self) -> str:
         """Get a description of the current tile."""
-        if not self.state.current_tile:
+        tile = self.state.current_tile
+        if not tile:
             return "You are in an unknown area."
         
-        # Get base description from tile
-        base_description = self.state.current_tile.get_description()
-        
-        # Enhance with environmental changes if available
-        if hasattr(self, 'game_systems') and hasattr(self.game_systems, 'discovery_system'):
-            enhanced_description = self.game_systems.enhance_tile_description(self.state.current_tile)
-            return enhanced_description
-        
-        return base_description 
\ No newline at end of file
+        return tile.get_description() 
\ No newline at end of file
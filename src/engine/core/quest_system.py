@@ -10,10 +10,11 @@ This module implements FromSoftware-style quest lines with:
 - Interconnected quest lines that affect each other
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Any
+from typing import Callable, Dict, List, Optional, Set, Tuple, Any
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+import operator
 
 from .models import StoryArea, EventType, GameEvent
 from .player import Player
@@ -41,15 +42,44 @@ class QuestTriggerType(str, Enum):
     ENVIRONMENTAL = "environmental"       # Player interacts with environment
     QUEST_STATUS = "quest_status"         # Another quest reaches a status
 
-@dataclass
+# Comparisons a condition string can use, checked in this order
+_CONDITION_OPERATORS = (("=", operator.eq), (">", operator.gt), ("<", operator.lt))
+
+def _compile_condition(condition: str) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Parse a trigger condition once into a check on the trigger's keyword arguments.
+    
+    "key=value" compares the argument as a string, while "key > n" and
+    "key < n" compare it as a number. Anything else never matches.
+    """
+    for symbol, compare in _CONDITION_OPERATORS:
+        if symbol in condition:
+            key, value = condition.split(symbol)
+            key, value = key.strip(), value.strip()
+            if compare is operator.eq:
+                return lambda kwargs: kwargs.get(key) == value
+            try:
+                number = float(value)
+            except ValueError:
+                break
+            return lambda kwargs: isinstance(kwargs.get(key), (int, float)) and compare(kwargs[key], number)
+    return lambda kwargs: False
+
+@dataclass(frozen=True, slots=True)
 class QuestTrigger:
     """A trigger that can advance a quest stage."""
     type: QuestTriggerType
     target: str                           # ID of the target (item, area, NPC, etc.)
     condition: Optional[str] = None       # Additional condition (e.g., "count > 3")
     hidden: bool = False                  # Whether this trigger is hidden from the player
+    _check: Optional[Callable[[Dict[str, Any]], bool]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Compile the condition once, so matching triggers don't re-parse it."""
+        if self.condition:
+            object.__setattr__(self, "_check", _compile_condition(self.condition))
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class QuestStage:
     """A stage in a quest."""
     id: str
@@ -62,7 +92,7 @@ class QuestStage:
     world_changes: List[Dict[str, Any]] = field(default_factory=list)  # Changes to make to world
     hint_dialogue: Dict[str, str] = field(default_factory=dict)  # NPC hints keyed by NPC ID
 
-@dataclass
+@dataclass(slots=True)
 class Quest:
     """A quest in the game."""
     id: str
@@ -85,9 +115,170 @@ class Quest:
             return None
         return self.stages.get(self.current_stage_id)
 
+# Hermit's Wisdom quest definition (Mystic path)
+def create_hermits_wisdom_quest() -> Quest:
+    """Create the Hermit's Wisdom quest."""
+    return Quest(
+        id="hermits_wisdom",
+        name="The Hermit's Wisdom",
+        description="Seek the ancient knowledge of the Hermit Druid.",
+        hidden_description="The Hermit Druid holds secrets about the true nature of the Second Centaur.",
+        initial_stage="find_hermit",
+        stages={
+            "find_hermit": QuestStage(
+                id="find_hermit",
+                description="Find the Hermit Druid in the western woods.",
+                hidden_description="The Hermit Druid is hiding from the Second Centaur's agents.",
+                triggers=[
+                    QuestTrigger(
+                        type=QuestTriggerType.NPC_DIALOGUE,
+                        target="hermit_druid"
+                    )
+                ],
+                next_stages=["retrieve_scroll"],
+                hint_dialogue={
+                    "fallen_warrior": "I've heard whispers of an old druid who lives to the west. They say he knows things about our past that most have forgotten."
+                }
+            ),
+            "retrieve_scroll": QuestStage(
+                id="retrieve_scroll",
+                description="The Hermit Druid has asked you to retrieve an ancient scroll from his meditation spot.",
+                hidden_description="The scroll contains a ritual that can weaken the Second Centaur.",
+                triggers=[
+                    QuestTrigger(
+                        type=QuestTriggerType.ITEM_ACQUIRED,
+                        target="ancient_scroll"
+                    )
+                ],
+                next_stages=["return_scroll", "study_scroll"],
+                hint_dialogue={
+                    "hermit_druid": "My meditation spot lies deeper in the grove. The scroll should still be there, unless... No, I'm sure it's safe."
+                }
+            ),
+            "study_scroll": QuestStage(
+                id="study_scroll",
+                description="Study the ancient scroll to learn its secrets.",
+                hidden_description="The scroll reveals the location of the Crystal Focus.",
+                triggers=[
+                    QuestTrigger(
+                        type=QuestTriggerType.ITEM_USED,
+                        target="ancient_scroll"
+                    )
+                ],
+                next_stages=["find_crystal"],
+                world_changes=[
+                    {"type": "reveal_item", "item_id": "crystal_focus", "location": (3, 4)}
+                ]
+            ),
+            "return_scroll": QuestStage(
+                id="return_scroll",
+                description="Return the scroll to the Hermit Druid.",
+                hidden_description="The Hermit will reveal more about your quest if you return the scroll.",
+                triggers=[
+                    QuestTrigger(
+                        type=QuestTriggerType.ITEM_GIVEN,
+                        target="ancient_scroll",
+                        condition="recipient=hermit_druid"
+                    )
+                ],
+                next_stages=["find_crystal"],
+                rewards=["hermit_blessing"],
+                hint_dialogue={
+                    "hermit_druid": "You've found it! Now, let me show you what it means..."
+                }
+            ),
+            "find_crystal": QuestStage(
+                id="find_crystal",
+                description="Find the Crystal Focus in the Mystic Mountains.",
+                hidden_description="The Crystal Focus is needed to see through the Second Centaur's illusions.",
+                triggers=[
+                    QuestTrigger(
+                        type=QuestTriggerType.ITEM_ACQUIRED,
+                        target="crystal_focus"
+                    )
+                ],
+                next_stages=["crystal_caves"],
+                hint_dialogue={
+                    "hermit_druid": "The Crystal Focus lies in the mountains to the north and west. It will reveal paths hidden to the naked eye."
+                }
+            ),
+            "crystal_caves": QuestStage(
+                id="crystal_caves",
+                description="Use the Crystal Focus to enter the Crystal Caves.",
+                hidden_description="The Crystal Caves contain the essence needed to challenge the Second Centaur.",
+                triggers=[
+                    QuestTrigger(
+                        type=QuestTriggerType.AREA_VISITED,
+                        target="crystal_caves"
+                    )
+                ],
+                next_stages=["defeat_guardian"],
+                world_changes=[
+                    {"type": "unlock_area", "area": "crystal_caves"}
+                ]
+            ),
+            "defeat_guardian": QuestStage(
+                id="defeat_guardian",
+                description="Defeat the Crystal Guardian to obtain its essence.",
+                hidden_description="The Guardian's essence contains the power of the original centaur lords.",
+                triggers=[
+                    QuestTrigger(
+                        type=QuestTriggerType.ENEMY_DEFEATED,
+                        target="crystal_guardian"
+                    )
+                ],
+                next_stages=["complete_mystic_path"],
+                rewards=["guardian_essence"],
+                hint_dialogue={
+                    "hermit_druid": "The Guardian will not yield easily, but its essence is crucial for your journey."
+                }
+            ),
+            "complete_mystic_path": QuestStage(
+                id="complete_mystic_path",
+                description="Use the knowledge and power you've gathered to confront the Second Centaur.",
+                hidden_description="The Mystic Path allows you to counter the Second Centaur's magical abilities.",
+                triggers=[
+                    QuestTrigger(
+                        type=QuestTriggerType.AREA_VISITED,
+                        target="shadow_domain"
+                    )
+                ],
+                next_stages=[],  # End of quest
+                world_changes=[
+                    {"type": "unlock_area", "area": "shadow_domain"}
+                ]
+            )
+        },
+        discovery_triggers=[
+            QuestTrigger(
+                type=QuestTriggerType.AREA_VISITED,
+                target="awakening_woods"
+            )
+        ],
+        related_quests=["warriors_honor", "shadows_embrace"],
+        required_items=["ancient_scroll", "crystal_focus", "guardian_essence"],
+        affected_npcs=["hermit_druid", "fallen_warrior"],
+        lore_entries=["centaur_wars", "crystal_magic", "first_centaur"]
+    )
+
+# Factories for the quests every QuestSystem starts with, keyed by quest ID
+QUEST_FACTORIES: Dict[str, Callable[[], Quest]] = {
+    "hermits_wisdom": create_hermits_wisdom_quest,
+    # Add more quests here...
+    # Warrior path quest
+    # Stealth path quest
+    # Side quests that can affect multiple paths
+}
+
 class QuestSystem:
     """Manages quests and their progression."""
     
+    __slots__ = (
+        'player', 'map_system', 'quests', 'active_quests', 'completed_quests', 'failed_quests',
+        '_quest_events', '_pending_events', 'discovered_lore', '_discovery_index', '_stage_trigger_index',
+        '_version', '_text_cache'
+    )
+    
     def __init__(self, player: Player, map_system: MapSystem):
         self.player = player
         self.map_system = map_system
@@ -95,257 +286,250 @@ class QuestSystem:
         self.active_quests: Set[str] = set()
         self.completed_quests: Set[str] = set()
         self.failed_quests: Set[str] = set()
-        self.quest_events: List[GameEvent] = []
+        # Events are logged as plain tuples and only turned into GameEvents
+        # when quest_events is read, since validating each one is costly
+        self._quest_events: List[GameEvent] = []
+        self._pending_events: List[Tuple[EventType, str, Tuple[int, int], Dict[str, str], datetime]] = []
         self.discovered_lore: Set[str] = set()
         
+        # Triggers indexed by (type, target), so a trigger check only visits
+        # the quests and stages it can actually affect
+        self._discovery_index: Dict[Tuple[QuestTriggerType, str], List[Tuple[str, QuestTrigger]]] = {}
+        # Stage entries are (trigger, fails) pairs, where fails marks a fail condition
+        self._stage_trigger_index: Dict[Tuple[str, str], Dict[Tuple[QuestTriggerType, str], List[Tuple[QuestTrigger, bool]]]] = {}
+        
+        # Rendered quest lists by kind, tagged with the version they were
+        # rendered at. Every change to quest state bumps the version.
+        self._version = 0
+        self._text_cache: Dict[str, Tuple[int, str]] = {}
+        
         # Initialize quests
         self._initialize_quests()
     
-    def _initialize_quests(self):
-        """Initialize all quests in the game."""
-        # Add the Hermit's Wisdom quest (Mystic path)
-        hermit_quest = Quest(
-            id="hermits_wisdom",
-            name="The Hermit's Wisdom",
-            description="Seek the ancient knowledge of the Hermit Druid.",
-            hidden_description="The Hermit Druid holds secrets about the true nature of the Second Centaur.",
-            initial_stage="find_hermit",
-            stages={
-                "find_hermit": QuestStage(
-                    id="find_hermit",
-                    description="Find the Hermit Druid in the western woods.",
-                    hidden_description="The Hermit Druid is hiding from the Second Centaur's agents.",
-                    triggers=[
-                        QuestTrigger(
-                            type=QuestTriggerType.NPC_DIALOGUE,
-                            target="hermit_druid"
-                        )
-                    ],
-                    next_stages=["retrieve_scroll"],
-                    hint_dialogue={
-                        "fallen_warrior": "I've heard whispers of an old druid who lives to the west. They say he knows things about our past that most have forgotten."
-                    }
-                ),
-                "retrieve_scroll": QuestStage(
-                    id="retrieve_scroll",
-                    description="The Hermit Druid has asked you to retrieve an ancient scroll from his meditation spot.",
-                    hidden_description="The scroll contains a ritual that can weaken the Second Centaur.",
-                    triggers=[
-                        QuestTrigger(
-                            type=QuestTriggerType.ITEM_ACQUIRED,
-                            target="ancient_scroll"
-                        )
-                    ],
-                    next_stages=["return_scroll", "study_scroll"],
-                    hint_dialogue={
-                        "hermit_druid": "My meditation spot lies deeper in the grove. The scroll should still be there, unless... No, I'm sure it's safe."
-                    }
-                ),
-                "study_scroll": QuestStage(
-                    id="study_scroll",
-                    description="Study the ancient scroll to learn its secrets.",
-                    hidden_description="The scroll reveals the location of the Crystal Focus.",
-                    triggers=[
-                        QuestTrigger(
-                            type=QuestTriggerType.ITEM_USED,
-                            target="ancient_scroll"
-                        )
-                    ],
-                    next_stages=["find_crystal"],
-                    world_changes=[
-                        {"type": "reveal_item", "item_id": "crystal_focus", "location": (3, 4)}
-                    ]
-                ),
-                "return_scroll": QuestStage(
-                    id="return_scroll",
-                    description="Return the scroll to the Hermit Druid.",
-                    hidden_description="The Hermit will reveal more about your quest if you return the scroll.",
-                    triggers=[
-                        QuestTrigger(
-                            type=QuestTriggerType.ITEM_GIVEN,
-                            target="ancient_scroll",
-                            condition="recipient=hermit_druid"
-                        )
-                    ],
-                    next_stages=["find_crystal"],
-                    rewards=["hermit_blessing"],
-                    hint_dialogue={
-                        "hermit_druid": "You've found it! Now, let me show you what it means..."
-                    }
-                ),
-                "find_crystal": QuestStage(
-                    id="find_crystal",
-                    description="Find the Crystal Focus in the Mystic Mountains.",
-                    hidden_description="The Crystal Focus is needed to see through the Second Centaur's illusions.",
-                    triggers=[
-                        QuestTrigger(
-                            type=QuestTriggerType.ITEM_ACQUIRED,
-                            target="crystal_focus"
-                        )
-                    ],
-                    next_stages=["crystal_caves"],
-                    hint_dialogue={
-                        "hermit_druid": "The Crystal Focus lies in the mountains to the north and west. It will reveal paths hidden to the naked eye."
-                    }
-                ),
-                "crystal_caves": QuestStage(
-                    id="crystal_caves",
-                    description="Use the Crystal Focus to enter the Crystal Caves.",
-                    hidden_description="The Crystal Caves contain the essence needed to challenge the Second Centaur.",
-                    triggers=[
-                        QuestTrigger(
-                            type=QuestTriggerType.AREA_VISITED,
-                            target="crystal_caves"
-                        )
-                    ],
-                    next_stages=["defeat_guardian"],
-                    world_changes=[
-                        {"type": "unlock_area", "area": "crystal_caves"}
-                    ]
-                ),
-                "defeat_guardian": QuestStage(
-                    id="defeat_guardian",
-                    description="Defeat the Crystal Guardian to obtain its essence.",
-                    hidden_description="The Guardian's essence contains the power of the original centaur lords.",
-                    triggers=[
-                        QuestTrigger(
-                            type=QuestTriggerType.ENEMY_DEFEATED,
-                            target="crystal_guardian"
-                        )
-                    ],
-                    next_stages=["complete_mystic_path"],
-                    rewards=["guardian_essence"],
-                    hint_dialogue={
-                        "hermit_druid": "The Guardian will not yield easily, but its essence is crucial for your journey."
-                    }
-                ),
-                "complete_mystic_path": QuestStage(
-                    id="complete_mystic_path",
-                    description="Use the knowledge and power you've gathered to confront the Second Centaur.",
-                    hidden_description="The Mystic Path allows you to counter the Second Centaur's magical abilities.",
-                    triggers=[
-                        QuestTrigger(
-                            type=QuestTriggerType.AREA_VISITED,
-                            target="shadow_domain"
-                        )
-                    ],
-                    next_stages=[],  # End of quest
-                    world_changes=[
-                        {"type": "unlock_area", "area": "shadow_domain"}
-                    ]
-                )
-            },
-            discovery_triggers=[
-                QuestTrigger(
-                    type=QuestTriggerType.AREA_VISITED,
-                    target="awakening_woods"
-                )
-            ],
-            related_quests=["warriors_honor", "shadows_embrace"],
-            required_items=["ancient_scroll", "crystal_focus", "guardian_essence"],
-            affected_npcs=["hermit_druid", "fallen_warrior"],
-            lore_entries=["centaur_wars", "crystal_magic", "first_centaur"]
-        )
+    def add_quest(self, quest: Quest) -> None:
+        """
+        Add a quest to the system, replacing any quest with the same ID.
         
-        # Add the quest to the system
-        self.quests["hermits_wisdom"] = hermit_quest
+        Quests must be added through here rather than stored in quests
+        directly, so their triggers are indexed and can fire.
         
-        # Add more quests here...
-        # Warrior path quest
-        # Stealth path quest
-        # Side quests that can affect multiple paths
+        Raises ValueError if the quest refers to a stage it doesn't define.
+        """
+        previous = self.quests.get(quest.id)
+        self._index_quest(quest, previous)
+        self.quests[quest.id] = quest
+        self._quest_changed()
+    
+    def _index_quest(self, quest: Quest, previous: Optional[Quest] = None) -> None:
+        """
+        Add a quest's discovery and stage triggers to the trigger indexes.
+        
+        Stage references are validated here, so starting and advancing the
+        quest can look stages up without checking for missing ones. World
+        change locations are also stored as tuples, so applying a change can
+        compare them to tile positions directly. The entries of a previous
+        quest with the same ID are removed first.
+        
+        Raises ValueError if the quest refers to a stage it doesn't define.
+        """
+        stages = quest.stages
+        if quest.initial_stage not in stages:
+            raise ValueError(f"Quest {quest.id} starts at unknown stage {quest.initial_stage}")
+        for stage in stages.values():
+            for next_stage_id in stage.next_stages:
+                if next_stage_id not in stages:
+                    raise ValueError(f"Quest {quest.id} stage {stage.id} leads to unknown stage {next_stage_id}")
+        
+        if previous is not None:
+            self._unindex_discovery(previous)
+            for stage_id in previous.stages:
+                self._stage_trigger_index.pop((quest.id, stage_id), None)
+        
+        for trigger in quest.discovery_triggers:
+            self._discovery_index.setdefault((trigger.type, trigger.target), []).append((quest.id, trigger))
+        
+        for stage_id, stage in quest.stages.items():
+            stage_index: Dict[Tuple[QuestTriggerType, str], List[Tuple[QuestTrigger, bool]]] = {}
+            for trigger in stage.triggers:
+                stage_index.setdefault((trigger.type, trigger.target), []).append((trigger, False))
+            for trigger in stage.fail_conditions:
+                stage_index.setdefault((trigger.type, trigger.target), []).append((trigger, True))
+            for change in stage.world_changes:
+                if "location" in change:
+                    change["location"] = tuple(change["location"])
+            self._stage_trigger_index[quest.id, stage_id] = stage_index
+    
+    def _initialize_quests(self):
+        """Initialize all quests in the game."""
+        for create_quest in QUEST_FACTORIES.values():
+            self.add_quest(create_quest())
+    
+    @property
+    def quest_events(self) -> List[GameEvent]:
+        """Get the quest event log, building GameEvents for any events logged since the last read."""
+        if self._pending_events:
+            self._quest_events.extend(
+                GameEvent(event_type=event_type, description=description, location=location,
+                          details=details, timestamp=timestamp)
+                for event_type, description, location, details, timestamp in self._pending_events
+            )
+            self._pending_events.clear()
+        return self._quest_events
+    
+    def _log_event(self, event_type: EventType, description: str, location: Tuple[int, int], details: Dict[str, str]) -> None:
+        """Record a quest event, deferring GameEvent construction until the log is read."""
+        self._pending_events.append((event_type, description, location, details, datetime.utcnow()))
+    
+    def _unindex_discovery(self, quest: Quest) -> None:
+        """Drop a discovered quest's triggers from the discovery index, so later checks skip them."""
+        for trigger in quest.discovery_triggers:
+            key = (trigger.type, trigger.target)
+            bucket = self._discovery_index.get(key)
+            if bucket:
+                bucket[:] = [entry for entry in bucket if entry[0] != quest.id]
+                if not bucket:
+                    del self._discovery_index[key]
     
     def check_quest_triggers(self, trigger_type: QuestTriggerType, target: str, **kwargs) -> List[str]:
         """
         Check if any quest triggers are activated.
         Returns a list of messages about quest progression.
         """
+        return self.check_quest_triggers_batch([(trigger_type, target, kwargs)])
+    
+    def check_quest_triggers_batch(self, events: List[Tuple[QuestTriggerType, str, Dict[str, Any]]]) -> List[str]:
+        """
+        Check several (trigger_type, target, kwargs) events in order, as
+        repeated check_quest_triggers calls would, sharing the per-call setup.
+        Returns the messages about quest progression for all events.
+        """
         messages = []
         
-        # Check for quest discovery triggers
-        for quest_id, quest in self.quests.items():
-            if quest.status == QuestStatus.HIDDEN:
-                for discovery_trigger in quest.discovery_triggers:
-                    if discovery_trigger.type == trigger_type and discovery_trigger.target == target:
-                        # Check additional conditions if any
-                        if discovery_trigger.condition:
-                            # Evaluate condition (simplified for now)
-                            if not self._evaluate_condition(discovery_trigger.condition, **kwargs):
-                                continue
-                        
-                        # Discover the quest
-                        quest.status = QuestStatus.DISCOVERED
-                        self.quest_events.append(GameEvent(
-                            event_type=EventType.DISCOVERY,
-                            description=f"Discovered quest: {quest.name}",
-                            location=self.player.get_current_position(),
-                            details={"quest_id": quest_id}
-                        ))
-                        messages.append(f"New quest discovered: {quest.name}")
-        
-        # Check for quest stage progression
-        for quest_id in self.active_quests:
-            quest = self.quests.get(quest_id)
-            if not quest or not quest.current_stage_id:
-                continue
+        position = self.player.get_current_position()  # The player can't move during a check
+        quests = self.quests
+        active_quests = self.active_quests
+        discovery_index = self._discovery_index
+        stage_trigger_index = self._stage_trigger_index
+        
+        for trigger_type, target, kwargs in events:
+            key = (trigger_type, target)
+            
+            # Check for quest discovery triggers. Discovered quests drop out of
+            # the index, so iterate over a copy of the bucket.
+            for quest_id, discovery_trigger in tuple(discovery_index.get(key, ())):
+                quest = quests[quest_id]
+                if quest.status == QuestStatus.HIDDEN:
+                    # Check additional conditions if any
+                    if discovery_trigger._check and not discovery_trigger._check(kwargs):
+                        continue
                 
-            current_stage = quest.get_current_stage()
-            if not current_stage:
-                continue
+                    # Discover the quest
+                    quest.status = QuestStatus.DISCOVERED
+                    self._quest_changed()
+                    self._unindex_discovery(quest)
+                    self._log_event(
+                        EventType.DISCOVERY,
+                        f"Discovered quest: {quest.name}",
+                        position,
+                        {"quest_id": quest_id}
+                    )
+                    messages.append(f"New quest discovered: {quest.name}")
+        
+            # Check for quest stage progression and failure. Quests that complete
+            # or fail leave the active set after the loop, not while it runs.
+            finished: List[str] = []
+            for quest_id in active_quests:
+                quest = quests.get(quest_id)
+                if not quest or not quest.current_stage_id:
+                    continue
+            
+                # Only the current stage's triggers and fail conditions for this key can fire
+                stage_index = stage_trigger_index.get((quest_id, quest.current_stage_id))
+                if not stage_index or key not in stage_index:
+                    continue
                 
-            for trigger in current_stage.triggers:
-                if trigger.type == trigger_type and trigger.target == target:
+                current_stage = quest.get_current_stage()
+                if not current_stage:
+                    continue
+                
+                for trigger, fails in stage_index[key]:
                     # Check additional conditions if any
-                    if trigger.condition:
-                        # Evaluate condition (simplified for now)
-                        if not self._evaluate_condition(trigger.condition, **kwargs):
-                            continue
-                    
-                    # Advance to next stage (taking first available for now)
+                    if trigger._check and not trigger._check(kwargs):
+                        continue
+                
+                    if fails:
+                        self._fail_quest(quest, messages)
+                        finished.append(quest_id)
+                        break
+                
+                    # Advance to next stage (taking first available for now).
+                    # The stage has changed, so its other triggers no longer apply.
                     if current_stage.next_stages:
-                        next_stage_id = current_stage.next_stages[0]
-                        quest.current_stage_id = next_stage_id
-                        next_stage = quest.stages.get(next_stage_id)
-                        
-                        # Apply rewards
-                        for reward in current_stage.rewards:
-                            if reward not in self.player.state.inventory:
-                                self.player.state.inventory.append(reward)
-                                messages.append(f"Received: {reward}")
-                        
-                        # Apply world changes
-                        for change in current_stage.world_changes:
-                            self._apply_world_change(change)
-                        
-                        # Record event
-                        self.quest_events.append(GameEvent(
-                            event_type=EventType.QUEST,
-                            description=f"Advanced quest '{quest.name}' to stage: {next_stage_id}",
-                            location=self.player.get_current_position(),
-                            details={"quest_id": quest_id, "stage_id": next_stage_id}
-                        ))
-                        
-                        messages.append(f"Quest updated: {quest.name}")
-                        if next_stage:
-                            messages.append(f"New objective: {next_stage.description}")
-                        
-                        # Check if this was the final stage
-                        if not next_stage or not next_stage.next_stages:
-                            quest.status = QuestStatus.COMPLETED
-                            self.active_quests.remove(quest_id)
-                            self.completed_quests.add(quest_id)
-                            messages.append(f"Quest completed: {quest.name}")
+                        if self._advance_stage(quest, current_stage, position, messages):
+                            finished.append(quest_id)
+                        break
+        
+            if finished:
+                active_quests.difference_update(finished)
         
         return messages
     
+    def _fail_quest(self, quest: Quest, messages: List[str]) -> None:
+        """Mark an active quest as failed. The caller removes it from active_quests."""
+        self._quest_changed()
+        quest.status = QuestStatus.FAILED
+        self.failed_quests.add(quest.id)
+        messages.append(f"Quest failed: {quest.name}")
+    
+    def _advance_stage(self, quest: Quest, current_stage: QuestStage, position: Tuple[int, int], messages: List[str]) -> bool:
+        """
+        Move an active quest on from its current stage, applying the stage's rewards and world changes.
+        
+        Returns True if the quest is now completed; the caller then removes
+        it from active_quests.
+        """
+        self._quest_changed()
+        next_stage_id = current_stage.next_stages[0]
+        quest.current_stage_id = next_stage_id
+        next_stage = quest.stages[next_stage_id]  # Validated by _index_quest
+        
+        # Apply rewards, checking ownership against one set
+        # rather than scanning the inventory per reward
+        if current_stage.rewards:
+            inventory = self.player.state.inventory
+            owned = set(inventory)
+            for reward in current_stage.rewards:
+                if reward not in owned:
+                    owned.add(reward)
+                    inventory.append(reward)
+                    messages.append(f"Received: {reward}")
+        
+        # Apply world changes
+        for change in current_stage.world_changes:
+            self._apply_world_change(change)
+        
+        # Record event
+        self._log_event(
+            EventType.QUEST,
+            f"Advanced quest '{quest.name}' to stage: {next_stage_id}",
+            position,
+            {"quest_id": quest.id, "stage_id": next_stage_id}
+        )
+        
+        messages.append(f"Quest updated: {quest.name}")
+        messages.append(f"New objective: {next_stage.description}")
+        
+        # Check if this was the final stage
+        if not next_stage.next_stages:
+            quest.status = QuestStatus.COMPLETED
+            self.completed_quests.add(quest.id)
+            messages.append(f"Quest completed: {quest.name}")
+            return True
+        return False
+    
     def _evaluate_condition(self, condition: str, **kwargs) -> bool:
         """Evaluate a condition string with given parameters."""
-        # Simple condition evaluation for now
-        # In a real implementation, this would be more sophisticated
-        if "=" in condition:
-            key, value = condition.split("=")
-            return kwargs.get(key.strip()) == value.strip()
-        return False
+        return _compile_condition(condition)(kwargs)
     
     def _apply_world_change(self, change: Dict[str, Any]):
         """Apply a world change from a quest stage."""
@@ -357,9 +541,10 @@ class QuestSystem:
             location = change.get("location")
             if item_id and location:
                 # Find the tile at this location and add the item
-                if self.player.state.current_tile and tuple(self.player.state.current_tile.position) == tuple(location):
-                    if item_id not in self.player.state.current_tile.items:
-                        self.player.state.current_tile.items.append(item_id)
+                current_tile = self.player.state.current_tile
+                if current_tile and current_tile.position == location:
+                    if item_id not in current_tile.items:
+                        current_tile.add_item(item_id)
         
         elif change_type == "unlock_area":
             # Logic to unlock an area
@@ -382,19 +567,19 @@ class QuestSystem:
         quest.status = QuestStatus.ACTIVE
         quest.current_stage_id = quest.initial_stage
         self.active_quests.add(quest_id)
+        self._quest_changed()
         
         # Record event
-        self.quest_events.append(GameEvent(
-            event_type=EventType.QUEST,
-            description=f"Started quest: {quest.name}",
-            location=self.player.get_current_position(),
-            details={"quest_id": quest_id}
-        ))
+        self._log_event(
+            EventType.QUEST,
+            f"Started quest: {quest.name}",
+            self.player.get_current_position(),
+            {"quest_id": quest_id}
+        )
         
-        current_stage = quest.get_current_stage()
-        if current_stage:
-            return True, f"Started quest: {quest.name}\nObjective: {current_stage.description}"
-        return True, f"Started quest: {quest.name}"
+        # The initial stage always exists, as _index_quest checks it
+        current_stage = quest.stages[quest.initial_stage]
+        return True, f"Started quest: {quest.name}\nObjective: {current_stage.description}"
     
     def get_quest_status(self, quest_id: str) -> Tuple[bool, str]:
         """Get the status of a specific quest."""
@@ -414,8 +599,30 @@ class QuestSystem:
                 
         return True, status_text
     
+    def _quest_changed(self) -> None:
+        """
+        Record that quest state changed, so rendered quest lists are rebuilt.
+        
+        Code that changes a quest's status or stage, or the active, completed
+        or failed sets, directly rather than through this class must call it.
+        """
+        self._version += 1
+    
+    def _cached_text(self, kind: str, render: Callable[[], str]) -> str:
+        """Get a rendered quest list, rendering it only if quest state changed since the last call."""
+        entry = self._text_cache.get(kind)
+        if entry is not None and entry[0] == self._version:
+            return entry[1]
+        text = render()
+        self._text_cache[kind] = (self._version, text)
+        return text
+    
     def get_active_quests(self) -> str:
         """Get a list of all active quests."""
+        return self._cached_text("active", self._render_active_quests)
+    
+    def _render_active_quests(self) -> str:
+        """Render the list of active quests."""
         if not self.active_quests:
             return "You have no active quests."
             
@@ -433,6 +640,10 @@ class QuestSystem:
     
     def get_completed_quests(self) -> str:
         """Get a list of all completed quests."""
+        return self._cached_text("completed", self._render_completed_quests)
+    
+    def _render_completed_quests(self) -> str:
+        """Render the list of completed quests."""
         if not self.completed_quests:
             return "You haven't completed any quests yet."
             
@@ -457,17 +668,25 @@ class QuestSystem:
         if not current_stage:
             return False, "Cannot find the current stage of this quest."
             
-        # Check if there are any NPCs in the current area that might have hints
-        if self.player.state.current_tile and self.player.state.current_tile.npcs:
-            for npc_id in self.player.state.current_tile.npcs:
-                if npc_id in current_stage.hint_dialogue:
-                    return True, f"{npc_id.replace('_', ' ').title()}: \"{current_stage.hint_dialogue[npc_id]}\""
+        # Check if there are any NPCs in the current area that might have hints.
+        # Tile NPCs are checked in order, so the first one with a hint answers.
+        hints = current_stage.hint_dialogue
+        current_tile = self.player.state.current_tile
+        if hints and current_tile and current_tile.npcs:
+            for npc_id in current_tile.npcs:
+                hint = hints.get(npc_id)
+                if hint is not None:
+                    return True, f"{npc_id.replace('_', ' ').title()}: \"{hint}\""
         
         # Generic hint if no NPC-specific hints are available
         return True, "You should explore more of the world to find clues."
     
     def get_quest_log(self) -> str:
         """Get a complete log of all quests and their statuses."""
+        return self._cached_text("log", self._render_quest_log)
+    
+    def _render_quest_log(self) -> str:
+        """Render the complete quest log."""
         log = []
         
         # Active quests
@@ -5,7 +5,7 @@ This module defines the stealth path quest line and related game mechanics.
 The stealth path focuses on subterfuge, evasion, and indirect approaches to problems.
 """
 
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Collection, Dict, List, NamedTuple, Optional, Tuple, Any
 from dataclasses import dataclass, field
 
 from .models import Item, Enemy, PathType, StoryArea
@@ -259,7 +259,7 @@ def create_stealth_quest() -> Quest:
     )
 
 # Stealth path-specific abilities
-STEALTH_ABILITIES = {
+STEALTH_ABILITIES: Dict[str, Dict[str, Any]] = {
     "shadow_step": {
         "name": "Shadow Step",
         "description": "Step into the shadows and move a short distance without being seen.",
@@ -308,6 +308,31 @@ STEALTH_ABILITIES = {
     }
 }
 
+class _AbilityRequirements(NamedTuple):
+    """What using a stealth ability requires, read once from its definition."""
+    stamina_cost: int
+    min_level: int
+    item: Optional[str]
+
+# Requirements of each stealth ability, so checks read fields instead of
+# walking the nested definition dicts. STEALTH_ABILITIES keeps its dict form
+# for path_system, which returns it alongside the other paths' abilities.
+_STEALTH_REQUIREMENTS: Dict[str, _AbilityRequirements] = {
+    ability_id: _AbilityRequirements(
+        stamina_cost=ability_data["stamina_cost"],
+        min_level=ability_data.get("requirements", {}).get("min_level", 1),
+        item=ability_data.get("requirements", {}).get("item")
+    )
+    for ability_id, ability_data in STEALTH_ABILITIES.items()
+}
+
+# (min_level, ability_id) for each stealth ability, lowest level first,
+# so progression only looks at abilities whose level was just reached
+_STEALTH_ABILITIES_BY_LEVEL: Tuple[Tuple[int, str], ...] = tuple(sorted(
+    ((requirements.min_level, ability_id) for ability_id, requirements in _STEALTH_REQUIREMENTS.items()),
+    key=lambda entry: entry[0]
+))
+
 # Stealth detection system
 @dataclass
 class StealthState:
@@ -329,30 +354,19 @@ class StealthState:
             carrying_weight: How much the player is carrying (0.0 to 1.0)
             in_combat: Whether the player is in combat
         """
-        # Base detection change
-        detection_change = 0.0
-        
-        # Light affects detection
-        if light_level > 0.7:
-            detection_change += 0.1  # Bright light increases detection
-        elif light_level < 0.3:
-            detection_change -= 0.1  # Darkness decreases detection
-            self.in_shadow = True
-        else:
-            self.in_shadow = False
+        # Light affects detection: bright light increases it, darkness
+        # decreases it and puts the player in shadow
+        self.in_shadow = light_level < 0.3
+        detection_change = 0.1 if light_level > 0.7 else (-0.1 if self.in_shadow else 0.0)
         
-        # Movement affects detection
-        detection_change += movement_speed * 0.2
-        
-        # Weight affects detection
-        detection_change += carrying_weight * 0.1
-        
-        # Combat drastically increases detection
+        # Movement and weight affect detection, and combat drastically increases it
+        detection_change += movement_speed * 0.2 + carrying_weight * 0.1
         if in_combat:
             detection_change += 0.3
         
         # Apply change with limits
-        self.detection_level = max(0.0, min(1.0, self.detection_level + detection_change))
+        level = self.detection_level + detection_change
+        self.detection_level = 0.0 if level < 0.0 else (1.0 if level > 1.0 else level)
         
         # Update hidden state
         self.is_hidden = self.detection_level < 0.5
@@ -372,14 +386,15 @@ class StealthState:
         # Update hidden state
         self.is_hidden = self.detection_level < 0.5
     
-    def apply_stealth_item_effects(self, items: List[str]) -> None:
+    def apply_stealth_item_effects(self, items: Collection[str]) -> None:
         """
         Apply effects from stealth items.
         
         Args:
-            items: List of item IDs the player has
+            items: Item IDs the player has; a set makes the lookups constant time
         """
-        if "shadow_cloak" in items and self.in_shadow:
+        # Check the flag first, so the items are only searched in shadow
+        if self.in_shadow and "shadow_cloak" in items:
             # Shadow cloak reduces detection by 75% in shadows
             self.detection_level *= 0.25
         
@@ -388,11 +403,13 @@ class StealthState:
     
     def update_cooldowns(self) -> None:
         """Update ability cooldowns."""
-        for ability, turns in list(self.cooldowns.items()):
-            if turns <= 1:
-                del self.cooldowns[ability]
-            else:
-                self.cooldowns[ability] = turns - 1
+        # Most turns have nothing cooling down
+        if self.cooldowns:
+            self.cooldowns = {
+                ability: turns - 1
+                for ability, turns in self.cooldowns.items()
+                if turns > 1
+            }
 
 # Stealth path progression system
 @dataclass
@@ -403,6 +420,7 @@ class StealthProgression:
     silent_kills: int = 0
     abilities_unlocked: List[str] = field(default_factory=list)
     detection_reduction: float = 0.0
+    _next_unlock: int = field(default=0, repr=False, compare=False)  # Index into _STEALTH_ABILITIES_BY_LEVEL
     
     def gain_experience(self, amount: int) -> Tuple[int, List[str]]:
         """
@@ -424,13 +442,16 @@ class StealthProgression:
         # Update stats based on new level
         self.detection_reduction = self.level * 0.05  # 5% per level
         
-        # Check for newly unlocked abilities
+        # Check for newly unlocked abilities, starting after the last one reached
         new_abilities = []
-        for ability_id, ability_data in STEALTH_ABILITIES.items():
-            min_level = ability_data.get("requirements", {}).get("min_level", 1)
-            if min_level <= self.level and ability_id not in self.abilities_unlocked:
+        index = self._next_unlock
+        while index < len(_STEALTH_ABILITIES_BY_LEVEL) and _STEALTH_ABILITIES_BY_LEVEL[index][0] <= self.level:
+            ability_id = _STEALTH_ABILITIES_BY_LEVEL[index][1]
+            if ability_id not in self.abilities_unlocked:
                 self.abilities_unlocked.append(ability_id)
                 new_abilities.append(ability_id)
+            index += 1
+        self._next_unlock = index
         
         return levels_gained, new_abilities
     
@@ -442,6 +463,12 @@ class StealthProgression:
         if self.silent_kills % 3 == 0:
             self.detection_reduction += 0.02  # Additional 2% reduction
 
+# Damage multiplier indexed by [is_silent_strike][target_is_unaware]
+_STEALTH_DAMAGE_MULTIPLIERS = (
+    (1.0, 2.0),
+    (1.5, 3.0),
+)
+
 # Helper functions for stealth path gameplay
 def calculate_stealth_damage(base_damage: int, player_level: int, weapon_damage: int,
                             is_silent_strike: bool = False,
@@ -460,18 +487,12 @@ def calculate_stealth_damage(base_damage: int, player_level: int, weapon_damage:
         Final damage value
     """
     damage = base_damage + weapon_damage + (player_level * 1.5)
-    
-    if is_silent_strike and target_is_unaware:
-        damage *= 3.0
-    elif target_is_unaware:
-        damage *= 2.0
-    elif is_silent_strike:
-        damage *= 1.5
+    damage *= _STEALTH_DAMAGE_MULTIPLIERS[bool(is_silent_strike)][bool(target_is_unaware)]
     
     return int(damage)
 
 def can_use_stealth_ability(ability_id: str, player_level: int,
-                           player_items: List[str],
+                           player_items: Collection[str],
                            player_stamina: int,
                            stealth_state: StealthState) -> Tuple[bool, str]:
     """
@@ -480,33 +501,32 @@ def can_use_stealth_ability(ability_id: str, player_level: int,
     Args:
         ability_id: ID of the ability to check
         player_level: Current stealth level
-        player_items: List of item IDs the player has
+        player_items: Item IDs the player has; a set makes the lookup constant time
         player_stamina: Current stamina value
         stealth_state: Current stealth state
         
     Returns:
         Tuple of (can use ability, reason if cannot)
     """
-    if ability_id not in STEALTH_ABILITIES:
+    requirements = _STEALTH_REQUIREMENTS.get(ability_id)
+    if requirements is None:
         return False, f"Unknown ability: {ability_id}"
     
-    ability = STEALTH_ABILITIES[ability_id]
-    
     # Check cooldown
-    if ability_id in stealth_state.cooldowns:
-        return False, f"Ability on cooldown for {stealth_state.cooldowns[ability_id]} more turns."
+    cooldown = stealth_state.cooldowns.get(ability_id)
+    if cooldown is not None:
+        return False, f"Ability on cooldown for {cooldown} more turns."
     
     # Check stamina cost
-    if player_stamina < ability["stamina_cost"]:
-        return False, f"Not enough stamina. Requires {ability['stamina_cost']} stamina."
+    if player_stamina < requirements.stamina_cost:
+        return False, f"Not enough stamina. Requires {requirements.stamina_cost} stamina."
     
     # Check level requirement
-    min_level = ability.get("requirements", {}).get("min_level", 1)
-    if player_level < min_level:
-        return False, f"Requires stealth level {min_level}."
+    if player_level < requirements.min_level:
+        return False, f"Requires stealth level {requirements.min_level}."
     
     # Check item requirement
-    required_item = ability.get("requirements", {}).get("item")
+    required_item = requirements.item
     if required_item and required_item not in player_items:
         return False, f"Requires item: {required_item}."
     
@@ -1,4 +1,5 @@
 from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import asdict
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy import select, update
@@ -465,7 +466,7 @@ class GameStateManager:
             "player_position": [x, y],
             "inventory": player.state.inventory,
             "visited_tiles": visited_tiles,
-            "player_stats": player.state.stats.__dict__ if hasattr(player.state, "stats") else {},
+            "player_stats": asdict(player.state.stats) if hasattr(player.state, "stats") else {},
             "game_time": player.time_system.current_time.isoformat() if hasattr(player, "time_system") and hasattr(player.time_system, "current_time") else None,
             "active_quests": player.state.active_quests if hasattr(player.state, "active_quests") else [],
             "completed_quests": player.state.completed_quests if hasattr(player.state, "completed_quests") else []
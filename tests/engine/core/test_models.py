@@ -4,6 +4,7 @@ Tests for core game engine models.
 
 import pytest
 from datetime import datetime
+from dataclasses import asdict
 from src.engine.core.models import (
     Direction, TerrainType, StoryArea, EventType,
     GameEvent, EnvironmentalChange, Item, Enemy,
@@ -80,6 +81,13 @@ def test_enemy_creation():
     assert enemy.damage == 3
     assert "rusty_sword" in enemy.drops
 
+def test_enemy_name_lower():
+    """Test that the lowercased name is stored once and stays out of the fields."""
+    enemy = Enemy(name="Goblin", description="A small but vicious goblin", health=20, damage=3)
+    assert enemy.name_lower == "goblin"
+    assert "name_lower" not in asdict(enemy)
+    assert Enemy(**asdict(enemy)) == enemy
+
 def test_tile_state_creation():
     """Test TileState model creation and validation."""
     tile = TileState(
@@ -115,6 +123,39 @@ def test_tile_state_position_validation():
     )
     assert tile.position == (0, 0)
 
+def test_tile_state_remove_enemy():
+    """Test removing an enemy from a tile by name."""
+    wolf = Enemy(name="Wolf", description="A fierce wolf", health=30, damage=5)
+    tile = TileState(
+        position=(0, 0),
+        terrain_type=TerrainType.FOREST,
+        area=StoryArea.AWAKENING_WOODS,
+        description="A dense forest area",
+        items=[],
+        enemies=[wolf]
+    )
+    assert tile.remove_enemy("bear") is None
+    assert tile.remove_enemy("WOLF") is wolf
+    assert tile.enemies == []
+
+def test_tile_state_items_copy_on_write():
+    """Test that shared tile items are copied before the first change."""
+    shared = ("rusty_sword",)
+    tile = TileState(
+        position=(0, 0),
+        terrain_type=TerrainType.FOREST,
+        area=StoryArea.AWAKENING_WOODS,
+        description="A dense forest area",
+        items=shared,
+        enemies=[]
+    )
+    assert tile.items is shared
+    
+    tile.add_item("stick")
+    tile.remove_item("rusty_sword")
+    assert tile.items == ["stick"]
+    assert shared == ("rusty_sword",)
+
 def test_game_state_creation():
     """Test GameState model creation and validation."""
     game_state = GameState(
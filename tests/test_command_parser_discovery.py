@@ -138,7 +138,7 @@ def test_movement_commands(mock_player, command_parser):
     result = command_parser.execute_command(Command(CommandType.MOVE, ["north"]))
     
     # Check that the player moved
-    mock_player.move.assert_called_with(Direction.NORTH)
+    mock_player.move.assert_called_with(Direction.NORTH, silent=True)
     assert "Moved" in result
 
 def test_parse_standard_commands(mock_player, command_parser):
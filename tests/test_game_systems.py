@@ -19,6 +19,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.engine.core.player import Player
 from src.engine.core.map_system import MapSystem
 from src.engine.core.game_systems import (
+    GameTime,
     TimeSystem, 
     AchievementSystem, 
     TitleSystem, 
@@ -80,6 +81,28 @@ def test_time_system():
     result = execute("status")
     assert "Day 2" in result  # Should have progressed to next day
 
+def test_game_time_long_jump():
+    """Test that a jump of several days carries into hours and days."""
+    game_time = GameTime()
+    game_time.add_minutes(2 * 24 * 60 + 17 * 60 + 45)  # 2 days, 17:45
+    assert (game_time.days, game_time.hours, game_time.minutes) == (4, 1, 45)
+    assert game_time.total_minutes == 2 * 24 * 60 + 17 * 60 + 45
+
+def test_leaderboard_entry_timestamp():
+    """Test that an entry's timestamp follows its date."""
+    entry = LeaderboardEntry(
+        player_id="test_player",
+        player_name="Test Player",
+        completion_time="Day 1, 12:00",
+        achievements=0,
+        path_type="warrior",
+        date=datetime(2024, 1, 1)
+    )
+    assert entry.timestamp == datetime(2024, 1, 1).timestamp()
+    
+    entry.date = datetime(2024, 6, 1)
+    assert entry.timestamp == datetime(2024, 6, 1).timestamp()
+
 def test_achievement_system():
     """Test the achievement tracking system."""
     map_system = MapSystem()
@@ -96,13 +96,13 @@ class TestMovementSystem:
             is_visited=True
         )
         player.state.inventory = []
-        player.state.visited_tiles = {(1, 0)}
+        player.state.visited_tiles = 1 << 1  # Bitmask with (1, 0) visited
         player.state.blocked_paths = {}
         player.map_system = map_system
         player.get_current_position.return_value = (1, 0)
         
         # Set up the move method to use the actual implementation
-        player.move = lambda direction: Player.move(player, direction)
+        player.move = lambda direction, **kwargs: Player.move(player, direction, **kwargs)
         
         return player
     
@@ -190,7 +190,7 @@ class TestMovementSystem:
     def test_blocked_paths(self, player):
         """Test that blocked paths prevent movement."""
         # Block the north path
-        player.state.blocked_paths[(1, 0)] = [Direction.NORTH]
+        Player.update_blocked_paths(player, "wolf_pack", Direction.NORTH, True)
         
         # Try to move north
         success, message = player.move(Direction.NORTH)
@@ -216,4 +216,148 @@ class TestMovementSystem:
         success, message = player.move(Direction.WEST)
         assert not success
         assert "cannot go that way" in message.lower()
-        assert player.state.position == (0, 1)  # Position unchanged 
\ No newline at end of file
+        assert player.state.position == (0, 1)  # Position unchanged 
+
+def test_node_enemies_are_normalized():
+    """Test that node enemies become Enemy objects whatever form they are stored in."""
+    map_system = MapSystem()
+    node = AreaNode(
+        area=StoryArea.TRIALS_PATH,
+        position=(0, 0),
+        connections=[],
+        terrain_type=TerrainType.FOREST,
+        base_description="Test area",
+        requirements=[],
+        enemies=["wolf_pack"],
+        items=[]
+    )
+    
+    # Enemy IDs are resolved against the world enemy table
+    enemies = map_system.get_node_enemies(node)
+    assert [enemy.name for enemy in enemies] == ["Wolf Pack"]
+    
+    # Raw dictionaries from saved state are converted in place
+    node.enemies = [{"name": "Test Wolf", "description": "A wolf", "health": 10, "damage": 1}]
+    assert map_system.get_node_enemies(node)[0].name == "Test Wolf"
+    
+    # Enemy objects pass through, in a list the tile can mutate freely
+    node.enemies = enemies
+    normalized = map_system.get_node_enemies(node)
+    assert normalized == enemies
+    assert normalized is not enemies
+
+
+def test_movement_history_is_in_visit_order():
+    """Test that movement history lists each tile once, in the order first visited."""
+    player = Player(MapSystem(), player_id="test_player", player_name="Test Player")
+    
+    for direction in (Direction.NORTH, Direction.SOUTH, Direction.EAST):
+        success, _ = player.move(direction)
+        assert success
+    
+    assert player.get_movement_history() == [(5, 0), (5, 1), (6, 0)]
+    
+    assert player.has_visited((5, 1))
+    assert not player.has_visited((9, 9))
+    assert not player.has_visited((-1, 0))
+    
+    # Only visited tiles can be inspected
+    assert player.get_tile_info((5, 1)) is not None
+    assert player.get_tile_info((9, 9)) is None
+    
+    # The map marks visited tiles and the player's position
+    map_rows = CommandParser(player).execute_map().split("\n")
+    assert map_rows[-1] == "     ·@   "
+    assert map_rows[-2] == "     ·    "
+    assert player.get_tile_info((-1, 0)) is None
+
+
+def test_possible_moves():
+    """Test possible move descriptions at the edge, in the open and when blocked."""
+    player = Player(MapSystem(), player_id="test_player", player_name="Test Player")
+    
+    # The starting tile sits on the southern edge of the map
+    moves = player.get_possible_moves()
+    assert moves[Direction.SOUTH] == "A shimmering magical barrier blocks your path."
+    assert moves[Direction.NORTH] == "Clear path."
+    
+    # In the middle of the map every direction is open
+    player.state.position = (5, 5)
+    assert set(player.get_possible_moves().values()) == {"Clear path."}
+    
+    # Results are copies, so changing one leaves later calls alone
+    player.get_possible_moves()[Direction.NORTH] = "changed"
+    assert player.get_possible_moves()[Direction.NORTH] == "Clear path."
+    assert "Position: (5, 5)\n" in player.get_status()
+    assert player._title_system is None  # Status doesn't create the title system
+    
+    # Without stamina nothing is reachable
+    player.state.stats.stamina = 0
+    assert set(player.get_possible_moves().values()) == {"Not enough stamina to move."}
+    
+    # A blocked path names the enemy standing in the way
+    player.state.stats.stamina = 100
+    player.state.current_tile.enemies = player.map_system.get_node_enemies(
+        AreaNode(
+            area=StoryArea.AWAKENING_WOODS,
+            position=(5, 5),
+            connections=[],
+            terrain_type=TerrainType.FOREST,
+            base_description="Test area",
+            requirements=[],
+            enemies=["wolf_pack"],
+            items=[]
+        )
+    )
+    player.update_blocked_paths("wolf_pack", Direction.NORTH, True)
+    moves = player.get_possible_moves()
+    assert moves[Direction.NORTH] == "Path blocked by Wolf Pack. Defeat it to proceed."
+    assert moves[Direction.EAST] == "Clear path."
+
+
+def test_snapshot_and_restore():
+    """Test that a snapshot returns the player to an earlier position."""
+    player = Player(MapSystem(), player_id="test_player", player_name="Test Player")
+    player.update_blocked_paths("wolf_pack", Direction.WEST, True)
+    snapshot = player.snapshot()
+    
+    player.move(Direction.NORTH)
+    player.update_blocked_paths("wolf_pack", Direction.WEST, False)
+    assert player.state.position == (5, 1)
+    
+    player.restore(snapshot)
+    assert player.state.position == (5, 0)
+    assert player.state.current_tile.position == player.state.position
+    assert player.state.current_area == StoryArea.AWAKENING_WOODS
+    assert player.get_movement_history() == [(5, 0)]
+    assert player._is_path_blocked(Direction.WEST)
+    
+    # Snapshots are immutable; variations are new objects
+    moved = snapshot.with_position(2, 3)
+    assert moved.position == (2, 3)
+    assert snapshot.position == (5, 0)
+
+
+def test_silent_move():
+    """Test that a silent move updates state without building a message."""
+    player = Player(MapSystem(), player_id="test_player", player_name="Test Player")
+    
+    assert player.move(Direction.NORTH, silent=True) == (True, "")
+    assert player.state.position == (5, 1)
+    assert player.get_movement_history() == [(5, 0), (5, 1)]
+    
+    # Failed moves still explain why
+    player.state.position = (5, 0)
+    assert player.move(Direction.SOUTH, silent=True) == (False, "You cannot go that way.")
+
+
+def test_areas_for_positions():
+    """Test that bulk area lookups match single lookups."""
+    player = Player(MapSystem(), player_id="test_player", player_name="Test Player")
+    positions = [(5, 0), (5, 9), (3, 3), (-1, 0)]
+    
+    areas = player._get_areas_for_positions(positions)
+    assert areas == [player._get_area_for_position(position) for position in positions]
+    
+    # Positions off the map keep the player's current area
+    assert areas[-1] == player.state.current_area
@@ -0,0 +1,233 @@
+"""
+Tests for the quest system in The Last Centaur.
+
+This module tests quest discovery and the trigger indexes that
+check_quest_triggers uses to find the quests a trigger can affect.
+"""
+
+import pytest
+from dataclasses import FrozenInstanceError
+
+from src.engine.core.models import EventType
+from src.engine.core.player import Player
+from src.engine.core.map_system import MapSystem
+from src.engine.core.quest_system import (
+    QuestSystem, Quest, QuestStage, QuestStatus, QuestTrigger, QuestTriggerType
+)
+
+
+@pytest.fixture
+def quest_system():
+    """Create a quest system for a new player."""
+    map_system = MapSystem()
+    player = Player(map_system, player_id="test_player", player_name="Test Player")
+    return QuestSystem(player, map_system)
+
+
+def test_trigger_indexes(quest_system):
+    """Test that discovery and stage triggers are indexed by type and target."""
+    assert quest_system._discovery_index[QuestTriggerType.AREA_VISITED, "awakening_woods"] == [
+        ("hermits_wisdom", quest_system.quests["hermits_wisdom"].discovery_triggers[0])
+    ]
+
+    stage_index = quest_system._stage_trigger_index["hermits_wisdom", "find_hermit"]
+    assert list(stage_index) == [(QuestTriggerType.NPC_DIALOGUE, "hermit_druid")]
+    assert stage_index[QuestTriggerType.NPC_DIALOGUE, "hermit_druid"][0][1] is False
+
+
+def test_discovery_trigger(quest_system):
+    """Test that a matching trigger discovers a hidden quest exactly once."""
+    assert quest_system.check_quest_triggers(QuestTriggerType.AREA_VISITED, "shadow_domain") == []
+
+    messages = quest_system.check_quest_triggers(QuestTriggerType.AREA_VISITED, "awakening_woods")
+    assert messages == ["New quest discovered: The Hermit's Wisdom"]
+    assert quest_system.quests["hermits_wisdom"].status == QuestStatus.DISCOVERED
+
+    # The discovery is logged, and built into a GameEvent when the log is read
+    [event] = quest_system.quest_events
+    assert event.event_type == EventType.DISCOVERY
+    assert event.location == (5, 0)
+    assert event.details == {"quest_id": "hermits_wisdom"}
+    assert quest_system.quest_events == [event]
+
+    # Already discovered quests leave the index and are not discovered again
+    assert (QuestTriggerType.AREA_VISITED, "awakening_woods") not in quest_system._discovery_index
+    assert quest_system.check_quest_triggers(QuestTriggerType.AREA_VISITED, "awakening_woods") == []
+
+
+def test_add_quest(quest_system):
+    """Test that a quest added after construction is discovered by its trigger."""
+    quest = Quest(
+        id="lost_relic",
+        name="The Lost Relic",
+        description="Recover the relic from the ruins.",
+        hidden_description="",
+        initial_stage="search_ruins",
+        stages={
+            "search_ruins": QuestStage(
+                id="search_ruins",
+                description="Search the ancient ruins.",
+                hidden_description="",
+                triggers=[QuestTrigger(type=QuestTriggerType.ITEM_ACQUIRED, target="relic")]
+            )
+        },
+        discovery_triggers=[QuestTrigger(type=QuestTriggerType.AREA_VISITED, target="ancient_ruins")]
+    )
+    quest_system.add_quest(quest)
+    assert quest_system.quests["lost_relic"] is quest
+
+    messages = quest_system.check_quest_triggers(QuestTriggerType.AREA_VISITED, "ancient_ruins")
+    assert messages == ["New quest discovered: The Lost Relic"]
+    assert quest.status == QuestStatus.DISCOVERED
+
+    # Replacing a quest drops the old quest's index entries
+    quest_system.add_quest(Quest(
+        id="lost_relic",
+        name="The Lost Relic",
+        description="",
+        hidden_description="",
+        initial_stage="search_vault",
+        stages={
+            "search_vault": QuestStage(id="search_vault", description="", hidden_description="", triggers=[])
+        }
+    ))
+    assert ("lost_relic", "search_ruins") not in quest_system._stage_trigger_index
+    assert quest_system._stage_trigger_index["lost_relic", "search_vault"] == {}
+
+
+def test_fail_condition(quest_system):
+    """Test that a fail condition of the current stage fails an active quest."""
+    quest = Quest(
+        id="escort",
+        name="The Escort",
+        description="Escort the merchant.",
+        hidden_description="The merchant is a spy.",
+        initial_stage="escort_merchant",
+        stages={
+            "escort_merchant": QuestStage(
+                id="escort_merchant",
+                description="Keep the merchant alive.",
+                hidden_description="",
+                triggers=[QuestTrigger(type=QuestTriggerType.AREA_VISITED, target="trials_path")],
+                fail_conditions=[QuestTrigger(type=QuestTriggerType.ENEMY_DEFEATED, target="merchant")]
+            )
+        },
+        status=QuestStatus.ACTIVE,
+        current_stage_id="escort_merchant"
+    )
+    quest_system.add_quest(quest)
+    quest_system.active_quests.add(quest.id)
+
+    # Another active quest is still checked while the failed one leaves the set
+    hermit_quest = quest_system.quests["hermits_wisdom"]
+    hermit_quest.status = QuestStatus.ACTIVE
+    hermit_quest.current_stage_id = "find_hermit"
+    quest_system.active_quests.add(hermit_quest.id)
+
+    quest_system._quest_changed()
+    assert "The Escort" in quest_system.get_active_quests()
+
+    messages = quest_system.check_quest_triggers(QuestTriggerType.ENEMY_DEFEATED, "merchant")
+    assert messages == ["Quest failed: The Escort"]
+    assert "The Escort" not in quest_system.get_active_quests()
+    assert quest.status == QuestStatus.FAILED
+    assert quest_system.failed_quests == {"escort"}
+    assert quest_system.active_quests == {"hermits_wisdom"}
+
+
+def test_trigger_conditions():
+    """Test that trigger conditions are compiled once and checked against arguments."""
+    given = QuestTrigger(type=QuestTriggerType.ITEM_GIVEN, target="ancient_scroll", condition="recipient=hermit_druid")
+    assert given._check({"recipient": "hermit_druid"})
+    assert not given._check({"recipient": "fallen_warrior"})
+    assert not given._check({})
+
+    counted = QuestTrigger(type=QuestTriggerType.ENEMY_DEFEATED, target="wolf_pack", condition="count > 3")
+    assert counted._check({"count": 4})
+    assert not counted._check({"count": 3})
+    assert not counted._check({"count": "many"})
+
+    assert QuestTrigger(type=QuestTriggerType.AREA_VISITED, target="awakening_woods")._check is None
+
+    # Triggers are fixed once created, so a compiled check can't go stale
+    with pytest.raises(FrozenInstanceError):
+        given.condition = "recipient=fallen_warrior"
+
+
+def test_reveal_item_world_change(quest_system):
+    """Test that a revealed item appears on the player's tile when the location matches."""
+    stage = quest_system.quests["hermits_wisdom"].stages["study_scroll"]
+    change = stage.world_changes[0]
+    assert change["location"] == (3, 4)
+
+    tile = quest_system.player.state.current_tile
+    tile.position = (3, 4)
+    quest_system._apply_world_change(change)
+    assert "crystal_focus" in tile.items
+
+
+def test_quest_log_follows_quest_changes(quest_system):
+    """Test that the cached quest log is rebuilt after each change to quest state."""
+    assert quest_system.get_quest_log() == "Your quest log is empty."
+    assert quest_system.get_quest_log() is quest_system.get_quest_log()
+
+    quest_system.check_quest_triggers(QuestTriggerType.AREA_VISITED, "awakening_woods")
+    assert quest_system.get_quest_log() == "Available Quests:\n- The Hermit's Wisdom"
+
+    # Direct changes are announced with _quest_changed
+    quest = quest_system.quests["hermits_wisdom"]
+    quest.status = QuestStatus.ACTIVE
+    quest.current_stage_id = "find_hermit"
+    quest_system.active_quests.add(quest.id)
+    quest_system._quest_changed()
+    assert quest_system.get_quest_log() == f"Active Quests:\n- The Hermit's Wisdom: {quest.stages['find_hermit'].description}"
+
+
+def test_quest_hint(quest_system):
+    """Test that an NPC on the current tile gives the current stage's hint."""
+    quest = quest_system.quests["hermits_wisdom"]
+    quest.status = QuestStatus.ACTIVE
+    quest.current_stage_id = "find_hermit"
+
+    tile = quest_system.player.state.current_tile
+    tile.npcs = ["merchant", "fallen_warrior"]
+    success, hint = quest_system.get_quest_hint("hermits_wisdom")
+    assert success
+    assert hint.startswith('Fallen Warrior: "I\'ve heard whispers')
+
+    tile.npcs = ["merchant"]
+    assert quest_system.get_quest_hint("hermits_wisdom") == (True, "You should explore more of the world to find clues.")
+
+
+def test_trigger_batch(quest_system):
+    """Test that a batch of events is checked in order, like separate calls."""
+    messages = quest_system.check_quest_triggers_batch([
+        (QuestTriggerType.AREA_VISITED, "shadow_domain", {}),
+        (QuestTriggerType.AREA_VISITED, "awakening_woods", {}),
+        (QuestTriggerType.AREA_VISITED, "awakening_woods", {}),
+    ])
+    assert messages == ["New quest discovered: The Hermit's Wisdom"]
+    assert quest_system.check_quest_triggers_batch([]) == []
+
+
+def test_unknown_stage_reference(quest_system):
+    """Test that a quest leading to a stage it doesn't define is rejected when indexed."""
+    quest = Quest(
+        id="broken",
+        name="Broken Quest",
+        description="",
+        hidden_description="",
+        initial_stage="start",
+        stages={
+            "start": QuestStage(
+                id="start",
+                description="",
+                hidden_description="",
+                triggers=[],
+                next_stages=["missing"]
+            )
+        }
+    )
+    with pytest.raises(ValueError, match="unknown stage missing"):
+        quest_system.add_quest(quest)
+    assert "broken" not in quest_system.quests
@@ -19,6 +19,9 @@ from src.engine.core.models import Direction, StoryArea
 from src.engine.core.player import Player
 from src.engine.core.map_system import MapSystem
 from src.engine.core.command_parser import CommandParser
+from src.engine.core.stealth_path import (
+    StealthProgression, StealthState, calculate_stealth_damage, can_use_stealth_ability
+)
 
 def test_stealth_path():
     """Test the complete Stealth Path through the game."""
@@ -258,5 +261,79 @@ def test_stealth_path():
     
     print("\nStealth Path Test Completed Successfully!")
 
+
+def test_stealth_progression_unlocks():
+    """Test that abilities unlock once, as their level is reached."""
+    progression = StealthProgression()
+    assert progression.gain_experience(0) == (0, ["void_whisper"])
+    assert progression.gain_experience(150) == (1, ["shadow_step"])
+    assert progression.gain_experience(10) == (0, [])
+    assert progression.gain_experience(200) == (2, ["silent_strike", "shadow_veil"])
+    assert progression.abilities_unlocked == ["void_whisper", "shadow_step", "silent_strike", "shadow_veil"]
+
+
+def test_can_use_stealth_ability():
+    """Test each requirement of a stealth ability in turn."""
+    state = StealthState()
+    assert can_use_stealth_ability("shadow_dance", 5, [], 100, state) == (False, "Unknown ability: shadow_dance")
+    assert can_use_stealth_ability("shadow_step", 5, ["shadow_cloak"], 10, state) == (False, "Not enough stamina. Requires 15 stamina.")
+    assert can_use_stealth_ability("shadow_step", 1, ["shadow_cloak"], 100, state) == (False, "Requires stealth level 2.")
+    assert can_use_stealth_ability("shadow_step", 5, [], 100, state) == (False, "Requires item: shadow_cloak.")
+    assert can_use_stealth_ability("shadow_step", 5, ["shadow_cloak"], 100, state) == (True, "")
+    
+    state.cooldowns["shadow_step"] = 2
+    assert can_use_stealth_ability("shadow_step", 5, ["shadow_cloak"], 100, state) == (False, "Ability on cooldown for 2 more turns.")
+
+
+def test_shadow_cloak_effect():
+    """Test that the shadow cloak only hides the player while in shadow."""
+    state = StealthState(detection_level=0.8)
+    state.apply_stealth_item_effects({"shadow_cloak"})
+    assert state.detection_level == 0.8
+    assert not state.is_hidden
+    
+    state.in_shadow = True
+    state.apply_stealth_item_effects({"shadow_cloak"})
+    assert state.detection_level == pytest.approx(0.2)
+    assert state.is_hidden
+
+
+def test_update_detection():
+    """Test that light, movement and combat change detection within its limits."""
+    state = StealthState()
+    state.update_detection(light_level=0.1, movement_speed=0.0, carrying_weight=0.0, in_combat=False)
+    assert state.in_shadow
+    assert state.detection_level == 0.0
+    assert state.is_hidden
+    
+    # Leaving the shadows for bright light clears the shadow flag
+    state.update_detection(light_level=0.9, movement_speed=1.0, carrying_weight=1.0, in_combat=True)
+    assert not state.in_shadow
+    assert state.detection_level == pytest.approx(0.7)
+    assert not state.is_hidden
+    
+    state.update_detection(light_level=0.9, movement_speed=1.0, carrying_weight=0.0, in_combat=True)
+    assert state.detection_level == 1.0
+
+
+def test_calculate_stealth_damage():
+    """Test the damage multiplier for each combination of strike and awareness."""
+    assert calculate_stealth_damage(10, 2, 5) == 18
+    assert calculate_stealth_damage(10, 2, 5, is_silent_strike=True) == 27
+    assert calculate_stealth_damage(10, 2, 5, target_is_unaware=True) == 36
+    assert calculate_stealth_damage(10, 2, 5, is_silent_strike=True, target_is_unaware=True) == 54
+
+
+def test_update_cooldowns():
+    """Test that cooldowns count down and expire."""
+    state = StealthState(cooldowns={"shadow_step": 2, "silent_strike": 1})
+    state.update_cooldowns()
+    assert state.cooldowns == {"shadow_step": 1}
+    
+    state.update_cooldowns()
+    assert state.cooldowns == {}
+    state.update_cooldowns()
+    assert state.cooldowns == {}
+
 if __name__ == "__main__":
-    test_stealth_path() 
\ No newline at end of file
+    test_stealth_path() 